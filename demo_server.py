@@ -1,37 +1,107 @@
 """
 Simple Demo Server for JIRA MCP Dashboard
 Serves the compliance UI without requiring database connection
+
+Runs under gunicorn (8 threads) by default; pass --debug for Flask's
+auto-reloading development server.
 """
 
-from flask import Flask, send_from_directory, jsonify
+from flask import Flask, Response, request
 from flask_cors import CORS
+import argparse
+import hashlib
+import json
 import os
+import sys
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to stdlib json
+    orjson = None
+
 app = Flask(__name__, static_folder='static')
 CORS(app)
 
+# Compliance UI page, read once at startup (restart the server to pick up edits)
+with open(os.path.join(app.static_folder, 'compliance-ui.html'), 'rb') as f:
+    _UI_HTML = f.read()
+_UI_ETAG = hashlib.md5(_UI_HTML).hexdigest()
+
+
+def _json_bytes(payload) -> bytes:
+    """Serialize a response payload (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+
+def _json(payload) -> Response:
+    """JSON response for a per-request payload."""
+    return Response(_json_bytes(payload), mimetype='application/json')
+
+
+# Static payloads (serialized once at import; served without rebuilding per request)
+_INDEX_JSON = _json_bytes({
+    'name': 'Jira MCP Dashboard API (Demo Mode)',
+    'version': '1.0.0',
+    'mode': 'DEMO - No database required',
+    'endpoints': {
+        '/': 'API info',
+        '/compliance': 'Compliance Report UI',
+        '/health': 'Health check',
+        '/api/reports/teams': 'List teams (demo data)',
+        '/api/reports/compliance/list': 'List reports (demo data)',
+        '/api/reports/compliance/demo': 'Generate demo report'
+    }
+})
+
+_TEAMS_JSON = _json_bytes({
+    'success': True,
+    'teams': [
+        {'id': 1, 'code': 'BEE', 'name': 'Backend Engineering Excellence'},
+        {'id': 2, 'code': 'AITEAM', 'name': 'AI Team'},
+        {'id': 3, 'code': 'DHAP', 'name': 'Digital Health Application Platform'},
+        {'id': 4, 'code': 'DEMT', 'name': 'Data Engineering and Management'},
+        {'id': 5, 'code': 'DEV', 'name': 'Development Team'},
+        {'id': 6, 'code': 'FRONT', 'name': 'Frontend Team'},
+        {'id': 7, 'code': 'ASA', 'name': 'Acumen Strategy Analytics'},
+        {'id': 8, 'code': 'CH', 'name': 'Corporate Health'},
+        {'id': 9, 'code': 'CT', 'name': 'Corporate Technology'},
+        {'id': 10, 'code': 'LEAD', 'name': 'Leadership Team'}
+    ]
+})
+
+_REPORTS_JSON = _json_bytes({
+    'success': True,
+    'reports': [
+        {
+            'filename': 'JIRA_Compliance_Report_20260131_073745.xlsx',
+            'created_at': '2026-01-31T07:37:45',
+            'size_bytes': 15360
+        },
+        {
+            'filename': 'JIRA_Compliance_Report_20260130_143022.xlsx',
+            'created_at': '2026-01-30T14:30:22',
+            'size_bytes': 14892
+        },
+        {
+            'filename': 'JIRA_Compliance_Report_20260129_091533.xlsx',
+            'created_at': '2026-01-29T09:15:33',
+            'size_bytes': 16124
+        }
+    ]
+})
+
 @app.route('/')
 def index():
     """Root endpoint with API info."""
-    return jsonify({
-        'name': 'Jira MCP Dashboard API (Demo Mode)',
-        'version': '1.0.0',
-        'mode': 'DEMO - No database required',
-        'endpoints': {
-            '/': 'API info',
-            '/compliance': 'Compliance Report UI',
-            '/health': 'Health check',
-            '/api/reports/teams': 'List teams (demo data)',
-            '/api/reports/compliance/list': 'List reports (demo data)',
-            '/api/reports/compliance/demo': 'Generate demo report'
-        }
-    })
+    return Response(_INDEX_JSON, mimetype='application/json')
 
 @app.route('/health')
 def health():
     """Health check endpoint."""
-    return jsonify({
+    return _json({
         'status': 'healthy',
         'mode': 'demo',
         'timestamp': datetime.utcnow().isoformat()
@@ -39,56 +109,27 @@ def health():
 
 @app.route('/compliance')
 def compliance_ui():
-    """Serve the compliance report UI."""
-    return send_from_directory('static', 'compliance-ui.html')
+    """Serve the compliance report UI (304 if the browser's copy is current)."""
+    response = Response(_UI_HTML, mimetype='text/html')
+    response.set_etag(_UI_ETAG)
+    response.cache_control.public = True
+    response.cache_control.max_age = 3600
+    return response.make_conditional(request)
 
 @app.route('/api/reports/teams')
 def get_teams():
     """Return demo teams data."""
-    return jsonify({
-        'success': True,
-        'teams': [
-            {'id': 1, 'code': 'BEE', 'name': 'Backend Engineering Excellence'},
-            {'id': 2, 'code': 'AITEAM', 'name': 'AI Team'},
-            {'id': 3, 'code': 'DHAP', 'name': 'Digital Health Application Platform'},
-            {'id': 4, 'code': 'DEMT', 'name': 'Data Engineering and Management'},
-            {'id': 5, 'code': 'DEV', 'name': 'Development Team'},
-            {'id': 6, 'code': 'FRONT', 'name': 'Frontend Team'},
-            {'id': 7, 'code': 'ASA', 'name': 'Acumen Strategy Analytics'},
-            {'id': 8, 'code': 'CH', 'name': 'Corporate Health'},
-            {'id': 9, 'code': 'CT', 'name': 'Corporate Technology'},
-            {'id': 10, 'code': 'LEAD', 'name': 'Leadership Team'}
-        ]
-    })
+    return Response(_TEAMS_JSON, mimetype='application/json')
 
 @app.route('/api/reports/compliance/list')
 def list_compliance_reports():
     """Return demo compliance reports list."""
-    return jsonify({
-        'success': True,
-        'reports': [
-            {
-                'filename': 'JIRA_Compliance_Report_20260131_073745.xlsx',
-                'created_at': '2026-01-31T07:37:45',
-                'size_bytes': 15360
-            },
-            {
-                'filename': 'JIRA_Compliance_Report_20260130_143022.xlsx',
-                'created_at': '2026-01-30T14:30:22',
-                'size_bytes': 14892
-            },
-            {
-                'filename': 'JIRA_Compliance_Report_20260129_091533.xlsx',
-                'created_at': '2026-01-29T09:15:33',
-                'size_bytes': 16124
-            }
-        ]
-    })
+    return Response(_REPORTS_JSON, mimetype='application/json')
 
 @app.route('/api/reports/compliance/demo', methods=['POST'])
 def generate_demo_report():
     """Simulate demo report generation."""
-    return jsonify({
+    return _json({
         'success': True,
         'message': 'Demo report generated successfully',
         'file_name': f'JIRA_Compliance_Report_Demo_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx',
@@ -99,7 +140,7 @@ def generate_demo_report():
 @app.route('/api/reports/compliance/generate', methods=['POST'])
 def generate_compliance_report():
     """Simulate compliance report generation."""
-    return jsonify({
+    return _json({
         'success': True,
         'message': 'Compliance report generated successfully (Demo Mode)',
         'file_name': f'JIRA_Compliance_Report_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx',
@@ -109,6 +150,10 @@ def generate_compliance_report():
     })
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='JIRA MCP Dashboard demo server')
+    parser.add_argument('--debug', action='store_true', help="Use Flask's auto-reloading development server")
+    args = parser.parse_args()
+    
     print("=" * 60)
     print("🚀 JIRA MCP Dashboard - Demo Server")
     print("=" * 60)
@@ -121,8 +166,22 @@ if __name__ == '__main__':
     print("   Using mock data for demonstration purposes")
     print("=" * 60)
     
+    if not args.debug:
+        try:
+            from gunicorn.app.wsgiapp import WSGIApplication
+        except ImportError:  # gunicorn is not available on Windows
+            WSGIApplication = None
+        
+        if WSGIApplication is not None:
+            sys.argv = [
+                'gunicorn', '--bind', '0.0.0.0:6922', '--threads', '8',
+                '--chdir', os.path.dirname(os.path.abspath(__file__)), 'demo_server:app'
+            ]
+            WSGIApplication().run()
+            sys.exit(0)
+    
     app.run(
         host='0.0.0.0',
         port=6922,
-        debug=True
+        debug=args.debug
     )
@@ -16,7 +16,7 @@ Output:
 
 import sys
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import argparse
 import time
 
@@ -158,7 +158,6 @@ def extract_users_batch_by_time(client: JiraClient):
 
 
 from src.utils.helpers import parse_jira_datetime
-import pytz
 import re
 
 def check_mit_compliance(issues, start_date, end_date):
@@ -283,7 +282,7 @@ def check_documentation_compliance(issues):
 def check_status_hygiene(issues):
     """Check for stale tickets."""
     stale_issues = 0
-    now = datetime.now(pytz.UTC)
+    now = datetime.now(timezone.utc)
     for issue in issues:
         fields = issue.get('fields', {})
         updated = parse_jira_datetime(fields.get('updated'))
@@ -324,7 +323,7 @@ def audit_employee(user, client: JiraClient, weeks=4):
     """Run compliance audit for a single employee."""
     print(f"   Running audit for {user['name']}...")
     
-    end_date = datetime.now(pytz.UTC)
+    end_date = datetime.now(timezone.utc)
     start_date = end_date - timedelta(weeks=weeks)
     date_str = start_date.strftime('%Y-%m-%d')
     
@@ -5,6 +5,7 @@ Provides REST endpoints for generating and downloading reports.
 
 import os
 from datetime import datetime, timedelta
+from io import BytesIO
 from flask import Blueprint, jsonify, request, send_file
 
 from src.reports.excel_builder import ExcelBuilder, generate_report
@@ -54,6 +55,41 @@ def generate_dashboard():
         }), 500
 
 
+@reports_bp.route('/generate/download', methods=['POST'])
+def generate_dashboard_download():
+    """
+    Generate a dashboard report and return it directly, without saving it to disk.
+    
+    Query params:
+        team_id: Optional team filter
+    
+    Returns:
+        Excel file download
+    """
+    try:
+        team_id = request.args.get('team_id', type=int)
+        
+        logger.info(f"Streamed report generation triggered: team_id={team_id}")
+        
+        builder = ExcelBuilder()
+        stream = builder.generate_dashboard(team_id=team_id, stream=BytesIO())
+        stream.seek(0)
+        
+        return send_file(
+            stream,
+            mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+            as_attachment=True,
+            download_name=builder.output_path.name
+        )
+        
+    except Exception as e:
+        logger.error(f"Report generation failed: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
 @reports_bp.route('/download/<filename>', methods=['GET'])
 def download_report(filename: str):
     """
@@ -368,7 +404,7 @@ def generate_audit_report():
     
     JSON Body:
         ticket_keys: List[str] - List of Jira issue keys
-        format: str - "markdown" or "json" (default: markdown)
+        format: str - "markdown", "json" or "excel" (default: markdown)
     """
     try:
         data = request.get_json()
@@ -415,10 +451,8 @@ def check_ticket_compliance(issue_key: str):
         jira_client = JiraClient()
         builder = AuditReportBuilder(jira_client)
         
-        # Hack: leverage existing private methods for single ticket check
-        # Ideally AuditReportBuilder would expose public check_ticket method
         ticket = builder._fetch_tickets_data([issue_key])[0]
-        result = builder._evaluate_ticket(ticket)
+        result = builder.evaluate_ticket(ticket)
         
         return jsonify({
             'success': True,
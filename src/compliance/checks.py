@@ -5,8 +5,9 @@ Supports both automated (Sheet 1) and manual/heuristic (Sheet 2) checks.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
-from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple
+from datetime import date
 import re
 
 from src.utils.logger import get_logger
@@ -14,6 +15,35 @@ from src.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+def _compile_keyword_pattern(keywords: List[str]) -> Optional[re.Pattern]:
+    """
+    Compile keywords into a single alternation matching any of them as a substring.
+    
+    Args:
+        keywords: Literal keywords (matched case-sensitively)
+        
+    Returns:
+        Compiled pattern, or None if there are no keywords
+    """
+    if not keywords:
+        return None
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+
+@lru_cache(maxsize=4096)
+def _weekday(date_str: str) -> int:
+    """Weekday (Monday=0) of a YYYY-MM-DD date; cached since comments share few dates."""
+    return date.fromisoformat(date_str).weekday()
+
+
+def _status_transitions(issue: Dict[str, Any]) -> Iterator[Tuple[Optional[str], Optional[str]]]:
+    """(fromString, toString) of each status change in the issue's changelog, oldest first."""
+    for history in issue.get('changelog', {}).get('histories', []):
+        for item in history.get('items', []):
+            if item.get('field') == 'status':
+                yield item.get('fromString'), item.get('toString')
+
+
 class ComplianceCheck(ABC):
     """
     Abstract base class for compliance checks.
@@ -21,6 +51,10 @@ class ComplianceCheck(ABC):
     All compliance checks must implement the evaluate() method.
     """
     
+    # JIRA fields read by evaluate() (changelog comes from expand);
+    # None means the check has not declared them and needs all fields
+    REQUIRED_FIELDS: Optional[FrozenSet[str]] = None
+    
     def __init__(self, config: Optional[Dict] = None):
         """
         Initialize check with configuration.
@@ -47,6 +81,21 @@ class ComplianceCheck(ABC):
         """
         pass
 
+    def batch_evaluate(self, issues: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Evaluate each issue independently against this check.
+
+        The default implementation calls evaluate() once per issue; checks
+        that can share work across a batch may override it.
+
+        Args:
+            issues: List of JIRA issues with full data
+
+        Returns:
+            Dictionary mapping issue key to its evaluate() result
+        """
+        return {issue.get('key'): self.evaluate([issue], None) for issue in issues}
+
     def _get_criterion_config(self, key: str) -> Dict:
         """Helper to get specific criterion config."""
         if not self.config:
@@ -126,6 +175,8 @@ class RecapToJiraConversionCheck(ComplianceCheck):
 class StatusHygieneCheck(ComplianceCheck):
     """Do statuses reflect actual execution/blockers?"""
     
+    REQUIRED_FIELDS = frozenset()  # changelog only
+    
     VALID_TRANSITIONS = {
         'To Do': ['In Progress', 'Backlog', 'Cancelled'],
         'Backlog': ['To Do', 'In Progress', 'Cancelled'],
@@ -144,16 +195,10 @@ class StatusHygieneCheck(ComplianceCheck):
             
         violations = []
         for issue in issues:
-            changelog = issue.get('changelog', {})
-            histories = changelog.get('histories', [])
-            for history in histories:
-                for item in history.get('items', []):
-                    if item.get('field') == 'status':
-                        from_s = item.get('fromString')
-                        to_s = item.get('toString')
-                        if from_s in self.VALID_TRANSITIONS:
-                            if to_s not in self.VALID_TRANSITIONS[from_s]:
-                                violations.append(f"{issue['key']}: {from_s} -> {to_s}")
+            for from_s, to_s in _status_transitions(issue):
+                if from_s in self.VALID_TRANSITIONS:
+                    if to_s not in self.VALID_TRANSITIONS[from_s]:
+                        violations.append(f"{issue['key']}: {from_s} -> {to_s}")
         
         if violations:
             return {"status": "Fail", "reason": f"Invalid transitions: {', '.join(violations[:3])}"}
@@ -163,20 +208,22 @@ class StatusHygieneCheck(ComplianceCheck):
 class CancellationCheck(ComplianceCheck):
     """Were tasks cancelled without approval? (Zero Tolerance)"""
     
+    REQUIRED_FIELDS = frozenset({'status', 'comment'})
+    
     APPROVAL_KEYWORDS = ['approved', 'approval', 'authorize', 'confirmed', 'ok to cancel', 'cancel ok']
     
+    # Any approval keyword, in one scan of each (lowercased) comment body
+    _APPROVAL_PATTERN = _compile_keyword_pattern(APPROVAL_KEYWORDS)
+    
     def evaluate(self, issues: List[Dict[str, Any]], employee: Any) -> Dict[str, Any]:
         unauthorized = []
+        approval_search = self._APPROVAL_PATTERN.search
         for issue in issues:
             status = issue['fields']['status']['name']
             if status == 'Cancelled':
                 # Check for comment
                 comments = issue['fields'].get('comment', {}).get('comments', [])
-                has_approval = False
-                for c in comments:
-                    if any(k in c.get('body', '').lower() for k in self.APPROVAL_KEYWORDS):
-                        has_approval = True
-                        break
+                has_approval = any(approval_search(c.get('body', '').lower()) for c in comments)
                 if not has_approval:
                     unauthorized.append(issue['key'])
         
@@ -188,6 +235,8 @@ class CancellationCheck(ComplianceCheck):
 class UpdateFrequencyCheck(ComplianceCheck):
     """Were updates shared per cadence?"""
     
+    REQUIRED_FIELDS = frozenset({'comment'})
+    
     def evaluate(self, issues: List[Dict[str, Any]], employee: Any) -> Dict[str, Any]:
         # Check for Wed/Fri comments
         wed_found = False
@@ -196,10 +245,9 @@ class UpdateFrequencyCheck(ComplianceCheck):
         for issue in issues:
             comments = issue['fields'].get('comment', {}).get('comments', [])
             for c in comments:
-                created = c.get('created')[:10] # YYYY-MM-DD
-                dt = datetime.strptime(created, '%Y-%m-%d')
-                if dt.weekday() == 2: wed_found = True
-                if dt.weekday() == 4: fri_found = True
+                weekday = _weekday(c.get('created')[:10]) # YYYY-MM-DD
+                if weekday == 2: wed_found = True
+                if weekday == 4: fri_found = True
         
         if wed_found and fri_found:
             return {"status": "Pass", "reason": "Updates on Wed and Fri"}
@@ -211,6 +259,8 @@ class UpdateFrequencyCheck(ComplianceCheck):
 class RoleOwnershipCheck(ComplianceCheck):
     """Is ownership/access correct?"""
     
+    REQUIRED_FIELDS = frozenset({'assignee', 'reporter'})
+    
     def evaluate(self, issues: List[Dict[str, Any]], employee: Any) -> Dict[str, Any]:
         errors = []
         for issue in issues:
@@ -232,6 +282,8 @@ class RoleOwnershipCheck(ComplianceCheck):
 class DocumentationCheck(ComplianceCheck):
     """Is metadata complete with audit trail?"""
     
+    REQUIRED_FIELDS = frozenset({'description', 'issuelinks', 'attachment'})
+    
     def evaluate(self, issues: List[Dict[str, Any]], employee: Any) -> Dict[str, Any]:
         issues_missing_data = []
         for issue in issues:
@@ -252,21 +304,18 @@ class DocumentationCheck(ComplianceCheck):
 class LifecycleCheck(ComplianceCheck):
     """Does lifecycle follow SOP steps/timings?"""
     
+    REQUIRED_FIELDS = frozenset({'status'})  # plus changelog
+    
     def evaluate(self, issues: List[Dict[str, Any]], employee: Any) -> Dict[str, Any]:
         # Check standard flow: Created -> In Progress -> Done
         violations = []
         for issue in issues:
-            changelog = issue.get('changelog', {})
-            histories = changelog.get('histories', [])
-            seen_statuses = set()
-            for h in histories:
-                for item in h.get('items', []):
-                    if item.get('field') == 'status':
-                        seen_statuses.add(item.get('toString'))
+            # Only finished issues can have skipped a step; others need no changelog scan
+            if issue['fields']['status']['name'] != 'Done':
+                continue
             
-            status = issue['fields']['status']['name']
-            if status == 'Done' and 'In Progress' not in seen_statuses:
-                 violations.append(f"{issue['key']}: Skipped In Progress")
+            if not any(to_s == 'In Progress' for _, to_s in _status_transitions(issue)):
+                violations.append(f"{issue['key']}: Skipped In Progress")
 
         if violations:
             return {"status": "Fail", "reason": f"Lifecycle skips: {', '.join(violations[:3])}"}
@@ -275,6 +324,9 @@ class LifecycleCheck(ComplianceCheck):
 
 class ZeroToleranceCheck(ComplianceCheck):
     """Legacy Zero Tolerance Check wrapper (for backward compatibility if needed)"""
+    
+    REQUIRED_FIELDS = frozenset()
+    
     def evaluate(self, issues: List[Dict[str, Any]], employee: Any) -> Dict[str, Any]:
          return {"status": "NA", "reason": "Handled by individual checks"}
 
@@ -295,11 +347,10 @@ class CommentQualityCheck(ComplianceCheck):
         bad_comments = []
         for issue in issues:
             comments = issue['fields'].get('comment', {}).get('comments', [])
-            for c in comments:
-                body = c.get('body', '')
-                if len(body.split()) < min_words:
-                    bad_comments.append(issue['key'])
-                    break
+            # Split at most min_words times: only need to know if the
+            # comment reaches the threshold, not its full word count
+            if any(len(c.get('body', '').split(None, min_words)) < min_words for c in comments):
+                bad_comments.append(issue['key'])
         
         if bad_comments:
              return {"status": "Fail", "reason": f"Short/vague comments in {', '.join(bad_comments[:3])}"}
@@ -368,15 +419,18 @@ class DescriptionQualityCheck(ComplianceCheck):
 class TitleQualityCheck(ComplianceCheck):
     """Does the title clearly describe the task?"""
     
+    def __init__(self, config: Optional[Dict] = None):
+        super().__init__(config)
+        heuristics = self._get_criterion_config('title_quality').get('heuristics', {})
+        self._generic_pattern = _compile_keyword_pattern(heuristics.get('avoid_generic', ['task', 'update']))
+    
     def evaluate(self, issues: List[Dict[str, Any]], employee: Any) -> Dict[str, Any]:
-        config = self._get_criterion_config('title_quality')
-        heuristics = config.get('heuristics', {})
-        bad_words = heuristics.get('avoid_generic', ['task', 'update'])
+        generic_search = self._generic_pattern.search if self._generic_pattern else None
         
         bad_titles = []
         for issue in issues:
             summary = issue['fields']['summary'].lower()
-            if any(w in summary for w in bad_words) or len(summary) < 10:
+            if len(summary) < 10 or (generic_search and generic_search(summary)):
                 bad_titles.append(issue['key'])
                 
         if bad_titles:
@@ -0,0 +1,198 @@
+"""
+Compliance Evaluation Module
+Shared employee-week evaluation used by the compliance report builder
+and the live dashboard data service.
+"""
+
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.compliance.checks import ComplianceCheck
+from src.utils.helpers import chunk_iter, safe_get
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Employees per bulk JQL query (keeps the 'in (...)' lists within JQL length limits)
+JQL_ACCOUNT_BATCH_SIZE = 50
+
+# Bulk weekly search; ids is a comma-separated list of quoted account IDs
+_WEEK_JQL = (
+    '(assignee in ({ids}) OR reporter in ({ids})) '
+    'AND updated >= "{start}" AND updated <= "{end}"'
+)
+
+# Fields used to file issues under their assignee and reporter
+_BUCKET_FIELDS = frozenset({'assignee', 'reporter'})
+
+
+def required_fields(checks: Dict[str, ComplianceCheck]) -> List[str]:
+    """
+    Union of the JIRA fields the checks read, for the search 'fields' parameter.
+
+    Args:
+        checks: Check instances keyed by check name
+
+    Returns:
+        Sorted field names, or ['*all'] if any check has not declared its fields
+    """
+    fields = set(_BUCKET_FIELDS)
+    for check in checks.values():
+        if check.REQUIRED_FIELDS is None:
+            return ['*all']
+        fields |= check.REQUIRED_FIELDS
+    return sorted(fields)
+
+
+def fetch_employee_issues_bulk(
+    jira: Any,
+    employees: List[Any],
+    week_start: datetime,
+    week_end: datetime,
+    fields: Optional[List[str]] = None
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Fetch all employees' JIRA issues for the week, grouped by account ID.
+
+    Issues are fetched with one JQL query per batch of employees rather
+    than one per employee, then filed under both their assignee and reporter.
+
+    Args:
+        jira: JiraClient instance
+        employees: JiraUser objects
+        week_start: Week start (Monday)
+        week_end: Week end (Sunday)
+        fields: JIRA fields to request (see required_fields); defaults to all
+
+    Returns:
+        Mapping of account ID to issue dictionaries
+    """
+    issues_by_account = defaultdict(list)
+    seen_keys = set()
+
+    # Week bounds are the same for every batch
+    start = week_start.strftime('%Y-%m-%d')
+    end = week_end.strftime('%Y-%m-%d')
+
+    for batch in chunk_iter(employees, JQL_ACCOUNT_BATCH_SIZE):
+        try:
+            # Issues where any employee is assignee OR reporter, updated in the week
+            ids = ",".join(f'"{employee.account_id}"' for employee in batch)
+            jql = _WEEK_JQL.format(ids=ids, start=start, end=end)
+
+            # Fetch issues with changelog expanded
+            for issue in jira.fetch_issues(
+                jql=jql,
+                fields=fields or ['*all'],
+                expand=['changelog'],
+                max_results=100
+            ):
+                # An issue can match two batches (assignee in one, reporter in another)
+                if issue['key'] in seen_keys:
+                    continue
+                seen_keys.add(issue['key'])
+
+                issue_fields = issue.get('fields', {})
+                account_ids = {
+                    safe_get(issue_fields, 'assignee', 'accountId'),
+                    safe_get(issue_fields, 'reporter', 'accountId')
+                }
+                for account_id in account_ids - {None}:
+                    issues_by_account[account_id].append(issue)
+
+        except Exception as e:
+            logger.error(f"Failed to fetch issues for week of {week_start.date()}: {e}")
+
+    logger.debug(f"Fetched {len(seen_keys)} issues for week of {week_start.date()}")
+    return issues_by_account
+
+
+def evaluate_employee_week(
+    checks: Dict[str, ComplianceCheck],
+    employee: Any,
+    issues: List[Dict[str, Any]]
+) -> Dict[str, str]:
+    """
+    Run all checks for one employee-week and format the result columns.
+
+    Args:
+        checks: Check instances keyed by check name (column order)
+        employee: JiraUser object
+        issues: Employee's issues updated during the week
+
+    Returns:
+        Legacy result string per check, plus overall_compliance and auditor_notes
+    """
+    # Run all compliance checks (structured {'status', 'reason'} results)
+    results = {}
+    for check_name, check in checks.items():
+        try:
+            results[check_name] = check.evaluate(issues, employee)
+        except Exception as e:
+            logger.error(f"Check {check_name} failed for {employee.display_name}: {e}")
+            results[check_name] = {'status': 'Error', 'reason': str(e)}
+
+    # Legacy Yes/No strings are only needed for the output cells
+    columns = {
+        check_name: to_legacy_format(result, check_name)
+        for check_name, result in results.items()
+    }
+    columns['overall_compliance'], columns['auditor_notes'] = summarize(results)
+    return columns
+
+
+def to_legacy_format(result: Dict[str, Any], check_name: str) -> str:
+    """Map new dictionary result to legacy string format."""
+    status = result.get('status', 'NA')
+    reason = result.get('reason', '')
+
+    if status == 'Pass':
+        if check_name == 'cancellation':
+            return "No" # cancellations: No means Pass (no unauthorized cancellations)
+        if check_name == 'zero_tolerance':
+            return "No" # zero_tolerance: No means Pass (no violations)
+        return "Yes"
+
+    elif status == 'Fail':
+        if check_name == 'cancellation':
+            return f"Yes - {reason}" # cancellation: Yes means Fail (violation found)
+        if check_name == 'zero_tolerance':
+            return "Yes" # zero_tolerance: Yes means Fail
+        return f"No - {reason}"
+
+    elif status == 'Error':
+        return "Error"
+
+    return "NA"
+
+
+def summarize(results: Dict[str, Dict[str, Any]]) -> Tuple[str, str]:
+    """
+    Calculate overall pass/fail and auditor notes in a single pass.
+
+    Logic: Fail if ANY check failed (including zero-tolerance violations) or
+    errored; every such check contributes one note.
+
+    Args:
+        results: Structured check results keyed by check name
+
+    Returns:
+        Tuple of (overall "Pass"/"Fail", human-readable notes)
+    """
+    issues = []
+
+    for check_name, result in results.items():
+        status = result.get('status')
+
+        if status == 'Fail':
+            if check_name == 'zero_tolerance':
+                issues.append("Zero-tolerance violation detected")
+            else:
+                issues.append(result.get('reason') or f"{check_name.replace('_', ' ').title()} failed")
+        elif status == 'Error':
+            issues.append(f"{check_name.replace('_', ' ').title()} check error")
+
+    if not issues:
+        return "Pass", "All checks passed"
+    return "Fail", "; ".join(issues)
@@ -71,23 +71,71 @@ class QueryHelpers:
             .all()
         )
         
-        results = []
-        for sprint, metrics in sprints:
-            results.append({
-                'sprint_id': sprint.id,
-                'sprint_name': sprint.name,
-                'start_date': sprint.start_date,
-                'end_date': sprint.end_date,
-                'points_committed': float(metrics.points_committed) if metrics else 0,
-                'points_completed': float(metrics.points_completed) if metrics else 0,
-                'issues_committed': metrics.issues_committed if metrics else 0,
-                'issues_completed': metrics.issues_completed if metrics else 0,
-                'velocity': float(metrics.velocity) if metrics and metrics.velocity else 0,
-                'completion_rate': float(metrics.completion_rate) if metrics and metrics.completion_rate else 0
-            })
+        return [self._velocity_row(sprint, metrics) for sprint, metrics in sprints]
+    
+    def get_team_velocity_bulk(self, team_ids: List[int], sprint_count: int = 5) -> Dict[int, List[Dict]]:
+        """
+        Get velocity metrics for several teams' last N sprints in one query.
+        
+        Args:
+            team_ids: Team IDs
+            sprint_count: Number of sprints to include per team
+            
+        Returns:
+            Velocity data per sprint (as get_team_velocity), keyed by team ID
+        """
+        results = {team_id: [] for team_id in team_ids}
+        if not team_ids:
+            return results
+        
+        # Rank each team's closed sprints, newest first
+        ranked = (
+            self.session.query(
+                JiraSprint.id.label('sprint_id'),
+                JiraProject.team_id.label('team_id'),
+                func.row_number().over(
+                    partition_by=JiraProject.team_id,
+                    order_by=desc(JiraSprint.end_date)
+                ).label('sprint_rank')
+            )
+            .join(JiraBoard, JiraSprint.board_id == JiraBoard.id)
+            .join(JiraProject, JiraBoard.project_id == JiraProject.id)
+            .filter(JiraProject.team_id.in_(team_ids))
+            .filter(JiraSprint.state == 'closed')
+            .subquery()
+        )
+        
+        sprints = (
+            self.session.query(ranked.c.team_id, JiraSprint, SprintMetric)
+            .select_from(ranked)
+            .join(JiraSprint, JiraSprint.id == ranked.c.sprint_id)
+            .outerjoin(SprintMetric, JiraSprint.id == SprintMetric.sprint_id)
+            .filter(ranked.c.sprint_rank <= sprint_count)
+            .order_by(ranked.c.team_id, ranked.c.sprint_rank)
+            .all()
+        )
+        
+        for team_id, sprint, metrics in sprints:
+            results[team_id].append(self._velocity_row(sprint, metrics))
         
         return results
     
+    @staticmethod
+    def _velocity_row(sprint: JiraSprint, metrics: Optional[SprintMetric]) -> Dict:
+        """Velocity data for one sprint."""
+        return {
+            'sprint_id': sprint.id,
+            'sprint_name': sprint.name,
+            'start_date': sprint.start_date,
+            'end_date': sprint.end_date,
+            'points_committed': float(metrics.points_committed) if metrics else 0,
+            'points_completed': float(metrics.points_completed) if metrics else 0,
+            'issues_committed': metrics.issues_committed if metrics else 0,
+            'issues_completed': metrics.issues_completed if metrics else 0,
+            'velocity': float(metrics.velocity) if metrics and metrics.velocity else 0,
+            'completion_rate': float(metrics.completion_rate) if metrics and metrics.completion_rate else 0
+        }
+    
     def get_sprint_metrics(self, sprint_id: int) -> Optional[Dict]:
         """Get detailed metrics for a specific sprint."""
         sprint = self.session.query(JiraSprint).filter(JiraSprint.id == sprint_id).first()
@@ -106,6 +154,62 @@ class QueryHelpers:
         total_points = sum(float(i.story_points or 0) for i in issues)
         completed_points = sum(float(i.story_points or 0) for i in issues if i.resolution_id is not None)
         
+        return self._sprint_metrics_row(sprint, total_issues, completed, total_points, completed_points)
+    
+    def get_sprint_metrics_bulk(self, sprint_ids: List[int]) -> Dict[int, Dict]:
+        """
+        Get detailed metrics for several sprints, with issue counts aggregated in one query.
+        
+        Args:
+            sprint_ids: Sprint IDs
+            
+        Returns:
+            Sprint metrics (as get_sprint_metrics) keyed by sprint ID; unknown sprints are omitted
+        """
+        if not sprint_ids:
+            return {}
+        
+        sprints = self.session.query(JiraSprint).filter(JiraSprint.id.in_(sprint_ids)).all()
+        
+        # Get issue counts per sprint
+        resolved = JiraIssue.resolution_id.isnot(None)
+        counts = {
+            r.sprint_id: r
+            for r in (
+                self.session.query(
+                    JiraIssue.sprint_id,
+                    func.count(JiraIssue.id).label('total'),
+                    func.count(JiraIssue.id).filter(resolved).label('completed'),
+                    func.coalesce(func.sum(JiraIssue.story_points), 0).label('points'),
+                    func.coalesce(func.sum(JiraIssue.story_points).filter(resolved), 0).label('completed_points')
+                )
+                .filter(JiraIssue.sprint_id.in_(sprint_ids))
+                .group_by(JiraIssue.sprint_id)
+                .all()
+            )
+        }
+        
+        results = {}
+        for sprint in sprints:
+            r = counts.get(sprint.id)
+            if r:
+                results[sprint.id] = self._sprint_metrics_row(
+                    sprint, r.total, r.completed, float(r.points), float(r.completed_points)
+                )
+            else:
+                results[sprint.id] = self._sprint_metrics_row(sprint, 0, 0, 0, 0)
+        
+        return results
+    
+    @staticmethod
+    def _sprint_metrics_row(
+        sprint: JiraSprint,
+        total_issues: int,
+        completed: int,
+        total_points: float,
+        completed_points: float
+    ) -> Dict:
+        """Detailed metrics for one sprint from its issue counts."""
         return {
             'sprint_id': sprint.id,
             'sprint_name': sprint.name,
@@ -219,6 +323,39 @@ class QueryHelpers:
             for r in results
         ]
     
+    def get_priority_distribution_bulk(self, team_ids: List[int]) -> Dict[int, List[Dict]]:
+        """Get issue distribution by priority for several teams in one query, keyed by team ID."""
+        distribution = {team_id: [] for team_id in team_ids}
+        if not team_ids:
+            return distribution
+        
+        results = (
+            self.session.query(
+                JiraProject.team_id,
+                JiraPriority.name.label('priority'),
+                JiraPriority.sort_order,
+                func.count(JiraIssue.id).label('total'),
+                func.count(JiraIssue.id).filter(JiraIssue.resolution_id.is_(None)).label('open'),
+                func.count(JiraIssue.id).filter(JiraIssue.resolution_id.isnot(None)).label('resolved')
+            )
+            .join(JiraIssue.priority)
+            .join(JiraProject, JiraIssue.project_id == JiraProject.id)
+            .filter(JiraProject.team_id.in_(team_ids))
+            .group_by(JiraProject.team_id, JiraPriority.name, JiraPriority.sort_order)
+            .order_by(JiraProject.team_id, JiraPriority.sort_order)
+            .all()
+        )
+        
+        for r in results:
+            distribution[r.team_id].append({
+                'priority': r.priority,
+                'total_count': r.total,
+                'open_count': r.open,
+                'resolved_count': r.resolved
+            })
+        
+        return distribution
+    
     def get_label_analysis(self, project_id: int) -> List[Dict]:
         """Get label usage analysis for a project."""
         results = (
@@ -259,6 +396,32 @@ class QueryHelpers:
             .all()
         )
         
+        return self._aging_buckets((issue.created_date for issue in issues), now)
+    
+    def get_ticket_aging_bulk(self, team_ids: List[int]) -> Dict[int, List[Dict]]:
+        """Get aging buckets for open tickets of several teams in one query, keyed by team ID."""
+        now = datetime.utcnow()
+        
+        created_dates = {team_id: [] for team_id in team_ids}
+        if team_ids:
+            rows = (
+                self.session.query(JiraProject.team_id, JiraIssue.created_date)
+                .join(JiraProject, JiraIssue.project_id == JiraProject.id)
+                .filter(JiraProject.team_id.in_(team_ids))
+                .filter(JiraIssue.resolution_id.is_(None))
+                .all()
+            )
+            for team_id, created_date in rows:
+                created_dates[team_id].append(created_date)
+        
+        return {
+            team_id: self._aging_buckets(dates, now)
+            for team_id, dates in created_dates.items()
+        }
+    
+    @staticmethod
+    def _aging_buckets(created_dates, now: datetime) -> List[Dict]:
+        """Count open tickets per age bucket from their creation dates."""
         buckets = {
             '0-7 days': 0,
             '8-14 days': 0,
@@ -268,8 +431,8 @@ class QueryHelpers:
             '90+ days': 0
         }
         
-        for issue in issues:
-            age = (now - issue.created_date).days
+        for created_date in created_dates:
+            age = (now - created_date).days
             if age <= 7:
                 buckets['0-7 days'] += 1
             elif age <= 14:
@@ -315,6 +478,35 @@ class QueryHelpers:
             for m in metrics
         ]
     
+    def get_ticket_totals(self, team_id: int = None, days: int = 30) -> Dict:
+        """
+        Get tickets created and resolved over the past N days in one aggregate query.
+        
+        Args:
+            team_id: Team ID, or None for all teams
+            days: Number of days to include
+            
+        Returns:
+            Dictionary with 'created' and 'resolved' totals
+        """
+        start_date = date.today() - timedelta(days=days)
+        
+        query = (
+            self.session.query(
+                func.coalesce(func.sum(DailyMetric.tickets_created), 0).label('created'),
+                func.coalesce(func.sum(DailyMetric.tickets_resolved), 0).label('resolved')
+            )
+            .filter(DailyMetric.metric_date >= start_date)
+        )
+        
+        if team_id:
+            query = query.filter(DailyMetric.team_id == team_id)
+        else:
+            query = query.filter(DailyMetric.team_id.isnot(None))
+        
+        totals = query.one()
+        return {'created': int(totals.created), 'resolved': int(totals.resolved)}
+    
     # ========================================
     # Component & Version Queries
     # ========================================
@@ -395,6 +587,38 @@ class QueryHelpers:
         total_estimated = sum(i.original_estimate or 0 for i in issues)
         total_spent = sum(i.time_spent or 0 for i in issues)
         
+        return self._time_tracking_summary(total_estimated, total_spent)
+    
+    def get_time_tracking_summary_bulk(self, team_ids: List[int]) -> Dict[int, Dict]:
+        """Get time tracking summaries for several teams in one query, keyed by team ID."""
+        totals = {team_id: (0, 0) for team_id in team_ids}
+        if team_ids:
+            results = (
+                self.session.query(
+                    JiraProject.team_id,
+                    func.coalesce(func.sum(JiraIssue.original_estimate), 0).label('estimated'),
+                    func.coalesce(func.sum(JiraIssue.time_spent), 0).label('spent')
+                )
+                .join(JiraProject)
+                .filter(JiraProject.team_id.in_(team_ids))
+                .filter(or_(
+                    JiraIssue.original_estimate.isnot(None),
+                    JiraIssue.time_spent.isnot(None)
+                ))
+                .group_by(JiraProject.team_id)
+                .all()
+            )
+            for r in results:
+                totals[r.team_id] = (int(r.estimated), int(r.spent))
+        
+        return {
+            team_id: self._time_tracking_summary(total_estimated, total_spent)
+            for team_id, (total_estimated, total_spent) in totals.items()
+        }
+    
+    @staticmethod
+    def _time_tracking_summary(total_estimated: int, total_spent: int) -> Dict:
+        """Time tracking summary from total estimated and spent seconds."""
         return {
             'total_estimated_hours': round(total_estimated / 3600, 2),
             'total_spent_hours': round(total_spent / 3600, 2),
@@ -3,6 +3,7 @@ Jira REST API Client Module
 Handles all communication with the Jira Cloud REST API.
 """
 
+import threading
 import time
 from datetime import datetime
 from typing import Any, Dict, Generator, List, Optional, Tuple
@@ -48,7 +49,11 @@ class JiraClient:
         self.max_retries = jira_config.get('max_retries', 3)
         self.retry_delay = jira_config.get('retry_delay', 1)
         
+        # Connection pooling (keep-alive connections reused across requests)
+        self.pool_maxsize = jira_config.get('pool_maxsize', 10)
+        
         self._last_request_time = 0
+        self._rate_lock = threading.Lock()
         self._session = self._create_session()
         
         logger.info(f"Jira client initialized for {self.base_url}")
@@ -63,6 +68,7 @@ class JiraClient:
         # Set default headers
         session.headers.update({
             'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
             'Content-Type': 'application/json'
         })
         
@@ -73,24 +79,31 @@ class JiraClient:
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=['GET', 'POST', 'PUT']
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=self.pool_maxsize,
+            pool_maxsize=self.pool_maxsize
+        )
         session.mount('https://', adapter)
         session.mount('http://', adapter)
         
         return session
     
     def _rate_limit(self) -> None:
-        """Apply rate limiting between requests."""
+        """Apply rate limiting between requests (safe to call from worker threads)."""
         if self.requests_per_second <= 0:
             return
         
         min_interval = 1.0 / self.requests_per_second
-        elapsed = time.time() - self._last_request_time
-        
-        if elapsed < min_interval:
-            time.sleep(min_interval - elapsed)
         
-        self._last_request_time = time.time()
+        # Serialize request starts so concurrent callers share one rate budget
+        with self._rate_lock:
+            elapsed = time.time() - self._last_request_time
+            
+            if elapsed < min_interval:
+                time.sleep(min_interval - elapsed)
+            
+            self._last_request_time = time.time()
     
     def _make_request(
         self,
@@ -0,0 +1,129 @@
+"""
+Audit Result Cache Module
+Persists per-ticket compliance check results between audit runs.
+
+A ticket whose 'updated' timestamp has not changed produces the same
+criterion results, so re-runs only evaluate tickets that changed.
+Entries are invalidated when the compliance criteria configuration or
+the check code (src.compliance.checks) changes.
+"""
+
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+from typing import Dict, List
+
+from src.compliance import checks
+from src.utils.helpers import chunk_iter
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Bump when the cached result format or the builder's use of it changes
+CACHE_SCHEMA_VERSION = 1
+
+# Any edit to the check implementations invalidates cached results
+_CHECKS_SOURCE_HASH = hashlib.sha256(Path(checks.__file__).read_bytes()).hexdigest()
+
+# Stay well below SQLite's bound-parameter limit
+_LOOKUP_BATCH_SIZE = 500
+
+
+class AuditResultCache:
+    """
+    SQLite-backed cache of per-ticket criterion results.
+
+    Keyed by issue key; an entry is valid only while both the ticket's
+    'updated' timestamp and the criteria configuration/check code hash match.
+    """
+
+    def __init__(self, db_path: Path, criteria_config: Dict):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            db_path: SQLite database file
+            criteria_config: Parsed compliance criteria configuration
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.config_hash = self._hash_config(criteria_config)
+
+        self._conn = sqlite3.connect(str(self.db_path))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS audit_cache ("
+            "issue_key TEXT PRIMARY KEY, "
+            "updated TEXT NOT NULL, "
+            "config_hash TEXT NOT NULL, "
+            "results TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _hash_config(criteria_config: Dict) -> str:
+        """Hash the criteria configuration together with the check code and cache schema version."""
+        payload = json.dumps(
+            {'schema': CACHE_SCHEMA_VERSION, 'checks': _CHECKS_SOURCE_HASH, 'config': criteria_config},
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get_many(self, tickets: List[Dict]) -> Dict[str, Dict[str, Dict]]:
+        """
+        Look up cached results for tickets.
+
+        Args:
+            tickets: Ticket dictionaries (need 'key' and fields.updated)
+
+        Returns:
+            Mapping of issue key to {check_id: result} for valid entries only
+        """
+        updated_by_key = {
+            t['key']: t['fields']['updated']
+            for t in tickets
+            if t.get('key') and t.get('fields', {}).get('updated')
+        }
+
+        hits = {}
+        for keys in chunk_iter(updated_by_key, _LOOKUP_BATCH_SIZE):
+            placeholders = ','.join('?' * len(keys))
+            rows = self._conn.execute(
+                f"SELECT issue_key, updated, config_hash, results FROM audit_cache "
+                f"WHERE issue_key IN ({placeholders})",
+                keys
+            )
+            for issue_key, updated, config_hash, results in rows:
+                if updated == updated_by_key[issue_key] and config_hash == self.config_hash:
+                    hits[issue_key] = json.loads(results)
+
+        logger.debug("Audit cache: %d/%d hits", len(hits), len(updated_by_key))
+        return hits
+
+    def put_many(self, tickets: List[Dict], results_by_key: Dict[str, Dict[str, Dict]]):
+        """
+        Store results for tickets, replacing any previous entries.
+
+        Args:
+            tickets: Evaluated ticket dictionaries
+            results_by_key: Mapping of issue key to {check_id: result}
+        """
+        rows = [
+            (t['key'], t['fields']['updated'], self.config_hash, json.dumps(results_by_key[t['key']]))
+            for t in tickets
+            if t.get('fields', {}).get('updated') and t['key'] in results_by_key
+        ]
+        if not rows:
+            return
+
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO audit_cache (issue_key, updated, config_hash, results) "
+            "VALUES (?, ?, ?, ?)",
+            rows
+        )
+        self._conn.commit()
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
@@ -9,12 +9,21 @@ Implements the Senior Compliance Auditor role:
 - Groups failures into actionable recommendations
 """
 
+from collections import Counter, defaultdict
 from datetime import datetime
+from functools import lru_cache
+import heapq
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import json
+import xlsxwriter
 import yaml
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to stdlib json
+    orjson = None
+
 from src.compliance.checks import (
     # Existing checks
     StatusHygieneCheck,
@@ -43,12 +52,75 @@ from src.compliance.checks import (
     EvidenceRelevanceCheck,
 )
 from src.jira_client import JiraClient
+from src.reports.audit_cache import AuditResultCache
 from src.database.connection import get_session
 from src.database.models import JiraUser
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Checks that only apply to MIT tickets, and to non-MIT tickets respectively
+MIT_ONLY_CHECKS = ('mit_planning', 'mit_creation', 'mit_completion')
+NON_MIT_ONLY_CHECKS = ('non_mit_tracking',)
+
+# Example failures listed per recommendation
+MAX_EXAMPLES_PER_RECOMMENDATION = 3
+
+
+def _failure_count(item: Tuple[str, List]) -> int:
+    """Sort key for (criterion, [count, rows]) failure entries."""
+    return item[1][0]
+
+
+# Markdown symbols for criterion status and overall ticket status
+_STATUS_SYMBOL = {'Pass': "✓", 'Fail': "✗"}
+_OVERALL_MARK = {
+    'COMPLIANT': "✅ **COMPLIANT**",
+    'NON-COMPLIANT': "❌ **NON-COMPLIANT**",
+    'ZERO_TOLERANCE_FAIL': "🚫 **ZERO TOLERANCE FAIL**",
+    'ERROR': "⚠️ **ERROR**",
+}
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+class AuditColumns:
+    """
+    Column-oriented view of per-ticket audit outcomes.
+    
+    Row i of every column describes audit_results[i]. fail_masks holds one
+    bit per failed criterion, using the builder's criterion bit indices.
+    """
+    
+    __slots__ = ('issue_keys', 'statuses', 'fail_masks')
+    
+    def __init__(self):
+        self.issue_keys: List[str] = []
+        self.statuses: List[str] = []
+        self.fail_masks: List[int] = []
+    
+    def append(self, issue_key: str, status: str, fail_mask: int):
+        """Record one ticket's outcome."""
+        self.issue_keys.append(issue_key)
+        self.statuses.append(status)
+        self.fail_masks.append(fail_mask)
+    
+    def __len__(self) -> int:
+        return len(self.statuses)
+
+
+@lru_cache(maxsize=8)
+def _load_criteria_config(path: str, mtime: float) -> Dict:
+    """
+    Parse the compliance criteria YAML, cached across builder instances.
+    
+    The file's mtime is part of the cache key so edits are picked up.
+    The returned dict is shared and must not be mutated.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
 
 class AuditReportBuilder:
     """
@@ -60,27 +132,37 @@ class AuditReportBuilder:
     - Grouped recommendations with actionable fixes
     """
     
-    def __init__(self, jira_client: JiraClient, output_dir: str = "./outputs/audit_reports"):
+    def __init__(
+        self,
+        jira_client: JiraClient,
+        output_dir: str = "./outputs/audit_reports",
+        use_cache: bool = False
+    ):
         """
         Initialize audit report builder.
         
         Args:
             jira_client: Authenticated JIRA client instance
             output_dir: Directory for output files
+            use_cache: Reuse check results for tickets unchanged since the last run
+                (persisted to audit_cache.sqlite in output_dir)
         """
         self.jira_client = jira_client
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
         # Load compliance criteria configuration
-        config_path = Path("config/compliance_criteria.yaml")
-        with open(config_path, 'r', encoding='utf-8') as f:
-            self.criteria_config = yaml.safe_load(f)
+        config_path = Path("config/compliance_criteria.yaml").resolve()
+        self.criteria_config = _load_criteria_config(str(config_path), config_path.stat().st_mtime)
         
         # Initialize all compliance checks
         self._initialize_compliance_checks()
         
-        logger.info(f"Audit report builder initialized with {len(self.all_checks)} compliance checks")
+        # Persistent per-ticket result cache (keyed by issue key + updated timestamp),
+        # opened only while checks run
+        self.result_cache_path = self.output_dir / "audit_cache.sqlite" if use_cache else None
+        
+        logger.info("Audit report builder initialized with %d compliance checks", len(self.all_checks))
     
     def _initialize_compliance_checks(self):
         """Initialize all compliance check instances."""
@@ -116,11 +198,28 @@ class AuditReportBuilder:
         
         # Combined all checks
         self.all_checks = {**self.core_checks, **self.manual_checks}
+        
+        # One bit per criterion, in evaluation order, for AuditColumns.fail_masks
+        self._criterion_ids = tuple(self.all_checks)
+        self._criterion_bits = {check_id: 1 << i for i, check_id in enumerate(self._criterion_ids)}
+        
+        # Flatten criterion config once; core entries win over manual ones
+        self._criterion_info = {
+            **self.criteria_config.get('manual_compliance', {}),
+            **self.criteria_config.get('core_process_compliance', {}),
+        }
+        self._category_by_id = {
+            cid: info.get('category', cid) for cid, info in self._criterion_info.items()
+        }
+        
+        # Resolve MIT identification once
+        self._initialize_mit_predicate()
     
     def generate_audit_report(
         self,
         ticket_keys: List[str],
-        output_format: str = "markdown"
+        output_format: str = "markdown",
+        max_recommendations: Optional[int] = None
     ) -> str:
         """
         Generate detailed compliance audit report for specific tickets.
@@ -128,26 +227,24 @@ class AuditReportBuilder:
         Args:
             ticket_keys: List of Jira issue keys to audit
             output_format: Output format (markdown, json, excel)
+            max_recommendations: Only report the N most frequent failure types (default: all)
             
         Returns:
             Path to generated report file
         """
-        logger.info(f"Generating audit report for {len(ticket_keys)} tickets")
+        logger.info("Generating audit report for %d tickets", len(ticket_keys))
         
         # Fetch all ticket data
         tickets_data = self._fetch_tickets_data(ticket_keys)
         
-        # Evaluate each ticket
-        audit_results = []
-        for ticket in tickets_data:
-            result = self._evaluate_ticket(ticket)
-            audit_results.append(result)
+        # Evaluate all tickets
+        audit_results, columns = self._evaluate_tickets(tickets_data)
         
         # Generate executive summary
-        summary = self._generate_executive_summary(audit_results)
+        summary = self._generate_executive_summary(audit_results, columns)
         
         # Generate recommendations
-        recommendations = self._generate_recommendations(audit_results)
+        recommendations = self._generate_recommendations(audit_results, columns, max_recommendations)
         
         # Format and save report
         if output_format == "markdown":
@@ -159,9 +256,49 @@ class AuditReportBuilder:
         else:
             raise ValueError(f"Unsupported output format: {output_format}")
         
-        logger.info(f"Audit report generated: {report_path}")
+        logger.info("Audit report generated: %s", report_path)
         return str(report_path)
     
+    def evaluate_ticket(self, ticket: Dict) -> Dict:
+        """
+        Evaluate a single fetched ticket against all applicable criteria.
+        
+        Args:
+            ticket: Ticket data dictionary (as returned by _fetch_tickets_data)
+            
+        Returns:
+            Evaluation result dictionary
+        """
+        audit_results, _ = self._evaluate_tickets([ticket])
+        return audit_results[0]
+    
+    def _evaluate_tickets(self, tickets_data: List[Dict]) -> Tuple[List[Dict], AuditColumns]:
+        """
+        Run each check once across all tickets, then aggregate per ticket.
+        
+        Args:
+            tickets_data: Fetched ticket dictionaries
+            
+        Returns:
+            Tuple of (per-ticket result dicts, column view of the same results)
+        """
+        mit_flags = {
+            ticket['key']: self._is_mit_ticket(ticket)
+            for ticket in tickets_data
+            if 'fetch_error' not in ticket
+        }
+        per_check_results = self._batch_evaluate_checks(tickets_data, mit_flags)
+        
+        audit_results = []
+        columns = AuditColumns()
+        for ticket in tickets_data:
+            result = self._evaluate_ticket(
+                ticket, per_check_results, mit_flags.get(ticket.get('key'), False), columns
+            )
+            audit_results.append(result)
+        
+        return audit_results, columns
+    
     def _fetch_tickets_data(self, ticket_keys: List[str]) -> List[Dict]:
         """
         Fetch full ticket data including changelog and comments.
@@ -177,12 +314,12 @@ class AuditReportBuilder:
             try:
                 ticket = self.jira_client.get_issue(
                     key,
-                    expand='changelog,renderedFields'
+                    expand=['changelog', 'renderedFields']
                 )
                 tickets.append(ticket)
-                logger.debug(f"Fetched ticket {key}")
+                logger.debug("Fetched ticket %s", key)
             except Exception as e:
-                logger.error(f"Failed to fetch ticket {key}: {e}")
+                logger.error("Failed to fetch ticket %s: %s", key, e)
                 # Add placeholder for failed fetch
                 tickets.append({
                     'key': key,
@@ -192,21 +329,104 @@ class AuditReportBuilder:
         
         return tickets
     
-    def _evaluate_ticket(self, ticket: Dict) -> Dict:
+    def _batch_evaluate_checks(
+        self,
+        tickets_data: List[Dict],
+        mit_flags: Dict[str, bool]
+    ) -> Dict[str, Dict[str, Dict]]:
         """
-        Evaluate a single ticket against all applicable criteria.
+        Evaluate every check once across all applicable tickets.
+        
+        Tickets unchanged since a previous run are served from the result
+        cache and skipped by the checks.
+        
+        Args:
+            tickets_data: Fetched ticket dictionaries
+            mit_flags: Mapping of issue key to MIT flag (fetched tickets only)
+            
+        Returns:
+            Mapping of check ID to {issue_key: result}
+        """
+        result_cache = (
+            AuditResultCache(self.result_cache_path, self.criteria_config)
+            if self.result_cache_path else None
+        )
+        try:
+            return self._run_checks(tickets_data, mit_flags, result_cache)
+        finally:
+            if result_cache:
+                result_cache.close()
+    
+    def _run_checks(
+        self,
+        tickets_data: List[Dict],
+        mit_flags: Dict[str, bool],
+        result_cache: Optional[AuditResultCache]
+    ) -> Dict[str, Dict[str, Dict]]:
+        """Run the checks for _batch_evaluate_checks, reading and updating result_cache if given."""
+        fetched = [t for t in tickets_data if t.get('key') in mit_flags]
+        cached = result_cache.get_many(fetched) if result_cache else {}
+        to_evaluate = [t for t in fetched if t['key'] not in cached]
+        
+        mit_tickets = [t for t in to_evaluate if mit_flags[t['key']]]
+        non_mit_tickets = [t for t in to_evaluate if not mit_flags[t['key']]]
+        all_tickets = mit_tickets + non_mit_tickets
+        
+        per_check_results = {}
+        for check_id, check in self.all_checks.items():
+            if check_id in MIT_ONLY_CHECKS:
+                batch = mit_tickets
+            elif check_id in NON_MIT_ONLY_CHECKS:
+                batch = non_mit_tickets
+            else:
+                batch = all_tickets
+            per_check_results[check_id] = check.batch_evaluate(batch)
+        
+        if result_cache:
+            # Store fresh results per ticket, then merge cached ones back in
+            fresh = {
+                t['key']: {
+                    check_id: results[t['key']]
+                    for check_id, results in per_check_results.items()
+                    if t['key'] in results
+                }
+                for t in to_evaluate
+            }
+            result_cache.put_many(to_evaluate, fresh)
+            
+            for issue_key, ticket_results in cached.items():
+                for check_id, result in ticket_results.items():
+                    per_check_results[check_id][issue_key] = result
+            
+            logger.info("Evaluated %d tickets, %d unchanged tickets served from cache", len(to_evaluate), len(cached))
+        
+        return per_check_results
+    
+    def _evaluate_ticket(
+        self,
+        ticket: Dict,
+        per_check_results: Dict[str, Dict[str, Dict]],
+        is_mit: bool,
+        columns: AuditColumns
+    ) -> Dict:
+        """
+        Aggregate pre-computed check results for a single ticket.
         
         Args:
             ticket: Ticket data dictionary
+            per_check_results: Batch results from _batch_evaluate_checks
+            is_mit: Whether the ticket is a MIT
+            columns: Column store that receives this ticket's outcome
             
         Returns:
             Evaluation result dictionary
         """
         issue_key = ticket.get('key', 'UNKNOWN')
-        logger.info(f"Evaluating ticket {issue_key}")
+        logger.debug("Evaluating ticket %s", issue_key)
         
         # Check if ticket fetch failed
         if 'fetch_error' in ticket:
+            columns.append(issue_key, 'ERROR', 0)
             return {
                 'issue_key': issue_key,
                 'overall_status': 'ERROR',
@@ -215,30 +435,30 @@ class AuditReportBuilder:
                 'zero_tolerance_violations': []
             }
         
-        # Determine if ticket is MIT or Non-MIT
-        is_mit = self._is_mit_ticket(ticket)
-        
-        # Evaluate applicable checks
+        # Aggregate applicable checks
         criteria_results = {}
         zero_tolerance_violations = []
         stop_evaluation = False
+        fail_mask = 0
+        criterion_bits = self._criterion_bits
         
-        # Evaluate core checks
-        for check_id, check in self.core_checks.items():
+        # Core checks
+        for check_id in self.core_checks:
             # Skip MIT-specific checks for non-MIT tickets
-            if check_id in ['mit_planning', 'mit_creation', 'mit_completion'] and not is_mit:
+            if check_id in MIT_ONLY_CHECKS and not is_mit:
                 criteria_results[check_id] = {'status': 'NA', 'reason': 'Not a MIT ticket'}
                 continue
             
             # Skip non-MIT checks for MIT tickets
-            if check_id == 'non_mit_tracking' and is_mit:
+            if check_id in NON_MIT_ONLY_CHECKS and is_mit:
                 criteria_results[check_id] = {'status': 'NA', 'reason': 'MIT ticket'}
                 continue
             
-            # Evaluate check
             if not stop_evaluation:
-                result = check.evaluate([ticket], None)
+                result = per_check_results[check_id][issue_key]
                 criteria_results[check_id] = result
+                if result.get('status') == 'Fail':
+                    fail_mask |= criterion_bits[check_id]
                 
                 # Check for zero-tolerance violation
                 if result.get('zero_tolerance') and result['status'] == 'Fail':
@@ -248,11 +468,13 @@ class AuditReportBuilder:
                     })
                     stop_evaluation = self.criteria_config['settings']['zero_tolerance_stops_evaluation']
         
-        # Evaluate manual checks (unless stopped)
+        # Manual checks (unless stopped)
         if not stop_evaluation:
-            for check_id, check in self.manual_checks.items():
-                result = check.evaluate([ticket], None)
+            for check_id in self.manual_checks:
+                result = per_check_results[check_id][issue_key]
                 criteria_results[check_id] = result
+                if result.get('status') == 'Fail':
+                    fail_mask |= criterion_bits[check_id]
                 
                 # Check for zero-tolerance violation
                 if result.get('zero_tolerance') and result['status'] == 'Fail':
@@ -263,7 +485,14 @@ class AuditReportBuilder:
                     stop_evaluation = self.criteria_config['settings']['zero_tolerance_stops_evaluation']
         
         # Calculate overall status
-        overall_status = self._calculate_overall_status(criteria_results, zero_tolerance_violations)
+        if zero_tolerance_violations:
+            overall_status = "ZERO_TOLERANCE_FAIL"
+        elif fail_mask:
+            overall_status = "NON-COMPLIANT"
+        else:
+            overall_status = "COMPLIANT"
+        
+        columns.append(issue_key, overall_status, fail_mask)
         
         return {
             'issue_key': issue_key,
@@ -275,118 +504,112 @@ class AuditReportBuilder:
             'ticket_status': ticket.get('fields', {}).get('status', {}).get('name', 'Unknown')
         }
     
-    def _is_mit_ticket(self, ticket: Dict) -> bool:
+    def _initialize_mit_predicate(self):
         """
-        Determine if ticket is a MIT (Most Important Task).
+        Bind _is_mit_ticket to the predicate for the configured MIT method.
         
-        Args:
-            ticket: Ticket data
-            
-        Returns:
-            True if MIT, False otherwise
+        The identification method is fixed for the builder's lifetime, so the
+        method dispatch and config lookups happen once here, not per ticket.
         """
         mit_config = self.criteria_config['settings']['mit_identification']
         method = mit_config['method']
         
-        fields = ticket.get('fields', {})
-        
-        if method == 'label':
-            labels = fields.get('labels', [])
-            return mit_config['label_name'] in labels
-        elif method == 'custom_field':
-            custom_field = fields.get(mit_config['custom_field_id'])
-            return custom_field is not None and custom_field == True
-        elif method == 'issue_type':
-            issue_type = fields.get('issuetype', {}).get('name', '')
-            return issue_type == mit_config['issue_type_name']
-        elif method == 'naming_pattern':
-            summary = fields.get('summary', '')
-            return mit_config['naming_pattern'] in summary.upper()
+        self._mit_label = mit_config.get('label_name')
+        self._mit_custom_field_id = mit_config.get('custom_field_id')
+        self._mit_issue_type_name = mit_config.get('issue_type_name')
+        self._mit_naming_pattern = mit_config.get('naming_pattern')
         
-        return False
+        predicates = {
+            'label': self._mit_by_label,
+            'custom_field': self._mit_by_custom_field,
+            'issue_type': self._mit_by_issue_type,
+            'naming_pattern': self._mit_by_naming_pattern,
+        }
+        self._is_mit_ticket = predicates.get(method, self._mit_never)
     
-    def _calculate_overall_status(
-        self,
-        criteria_results: Dict,
-        zero_tolerance_violations: List[Dict]
-    ) -> str:
-        """
-        Calculate overall compliance status for ticket.
-        
-        Args:
-            criteria_results: All criteria evaluation results
-            zero_tolerance_violations: List of zero-tolerance violations
-            
-        Returns:
-            Overall status: COMPLIANT, NON-COMPLIANT, or ZERO_TOLERANCE_FAIL
-        """
-        if zero_tolerance_violations:
-            return "ZERO_TOLERANCE_FAIL"
-        
-        # Check if any criterion failed
-        for criterion, result in criteria_results.items():
-            if isinstance(result, dict) and result.get('status') == 'Fail':
-                return "NON-COMPLIANT"
-        
-        return "COMPLIANT"
+    def _mit_by_label(self, ticket: Dict) -> bool:
+        """MIT if the configured label is present."""
+        return self._mit_label in ticket.get('fields', {}).get('labels', ())
     
-    def _generate_executive_summary(self, audit_results: List[Dict]) -> Dict:
+    def _mit_by_custom_field(self, ticket: Dict) -> bool:
+        """MIT if the configured custom field is set to True."""
+        return ticket.get('fields', {}).get(self._mit_custom_field_id) == True
+    
+    def _mit_by_issue_type(self, ticket: Dict) -> bool:
+        """MIT if the issue type matches the configured name."""
+        return ticket.get('fields', {}).get('issuetype', {}).get('name', '') == self._mit_issue_type_name
+    
+    def _mit_by_naming_pattern(self, ticket: Dict) -> bool:
+        """MIT if the summary contains the configured naming pattern."""
+        return self._mit_naming_pattern in ticket.get('fields', {}).get('summary', '').upper()
+    
+    def _mit_never(self, ticket: Dict) -> bool:
+        """Fallback for unknown identification methods."""
+        return False
+    
+    def _generate_executive_summary(self, audit_results: List[Dict], columns: AuditColumns) -> Dict:
         """Generate executive summary statistics."""
-        total = len(audit_results)
-        compliant = sum(1 for r in audit_results if r['overall_status'] == 'COMPLIANT')
-        non_compliant = sum(1 for r in audit_results if r['overall_status'] == 'NON-COMPLIANT')
-        zero_tolerance_fails = sum(1 for r in audit_results if r['overall_status'] == 'ZERO_TOLERANCE_FAIL')
+        total = len(columns)
+        status_counts = Counter(columns.statuses)
         
-        # Collect zero-tolerance violations
-        zt_violations = {}
-        for result in audit_results:
-            for violation in result.get('zero_tolerance_violations', []):
-                criterion = violation['criterion']
-                if criterion not in zt_violations:
-                    zt_violations[criterion] = []
-                zt_violations[criterion].append(result['issue_key'])
+        # Only zero-tolerance failures carry violations
+        zt_violations = defaultdict(list)
+        for i, status in enumerate(columns.statuses):
+            if status == 'ZERO_TOLERANCE_FAIL':
+                for violation in audit_results[i]['zero_tolerance_violations']:
+                    zt_violations[violation['criterion']].append(columns.issue_keys[i])
+        
+        compliant = status_counts['COMPLIANT']
         
         return {
             'total_audited': total,
             'compliant_count': compliant,
-            'non_compliant_count': non_compliant,
-            'zero_tolerance_count': zero_tolerance_fails,
+            'non_compliant_count': status_counts['NON-COMPLIANT'],
+            'zero_tolerance_count': status_counts['ZERO_TOLERANCE_FAIL'],
             'compliance_rate': (compliant / total * 100) if total > 0 else 0,
-            'zero_tolerance_violations': zt_violations
+            'zero_tolerance_violations': dict(zt_violations)
         }
     
-    def _generate_recommendations(self, audit_results: List[Dict]) -> List[Dict]:
+    def _generate_recommendations(
+        self,
+        audit_results: List[Dict],
+        columns: AuditColumns,
+        top_k: Optional[int] = None
+    ) -> List[Dict]:
         """
         Generate actionable recommendations grouped by failure type.
         
         Args:
             audit_results: All ticket audit results
+            columns: Column view of the same results
+            top_k: Only keep the K most frequent failure types (default: all)
             
         Returns:
             List of recommendation dictionaries
         """
-        # Group failures by criterion
-        failure_counts = {}
-        failure_examples = {}
-        
-        for result in audit_results:
-            for criterion, check_result in result.get('criteria_results', {}).items():
-                if isinstance(check_result, dict) and check_result.get('status') == 'Fail':
-                    if criterion not in failure_counts:
-                        failure_counts[criterion] = 0
-                        failure_examples[criterion] = []
-                    failure_counts[criterion] += 1
-                    failure_examples[criterion].append({
-                        'issue_key': result['issue_key'],
-                        'reason': check_result.get('reason', 'N/A')
-                    })
-        
-        # Sort by frequency
-        sorted_failures = sorted(failure_counts.items(), key=lambda x: x[1], reverse=True)
+        # Group failures by criterion from the fail bitmasks: [count, first example rows];
+        # dict order follows first appearance, matching a scan of the result dicts
+        criterion_ids = self._criterion_ids
+        failures = defaultdict(lambda: [0, []])
+        
+        for row, mask in enumerate(columns.fail_masks):
+            while mask:
+                low_bit = mask & -mask
+                entry = failures[criterion_ids[low_bit.bit_length() - 1]]
+                entry[0] += 1
+                if len(entry[1]) < MAX_EXAMPLES_PER_RECOMMENDATION:
+                    entry[1].append(row)
+                mask ^= low_bit
+        
+        # Sort by frequency (ties keep first-appearance order)
+        if top_k is None:
+            sorted_failures = sorted(failures.items(), key=_failure_count, reverse=True)
+        else:
+            sorted_failures = heapq.nlargest(top_k, failures.items(), key=_failure_count)
         
         # Generate recommendations
         recommendations = []
-        for criterion, count in sorted_failures:
+        for criterion, (count, rows) in sorted_failures:
             # Get criterion info from config
             criterion_info = self._get_criterion_info(criterion)
             
@@ -394,26 +617,26 @@ class AuditReportBuilder:
             
             recommendations.append({
                 'criterion': criterion,
-                'category': criterion_info.get('category', criterion),
+                'category': self._category_by_id.get(criterion, criterion),
                 'failed_count': count,
                 'zero_tolerance': is_zero_tolerance,
                 'issue': criterion_info.get('failure_looks_like', ''),
                 'fix': self._generate_fix_suggestion(criterion, criterion_info),
                 'priority': 'CRITICAL' if is_zero_tolerance else ('HIGH' if count > 3 else 'MEDIUM'),
-                'examples': failure_examples[criterion][:3]  # Top 3 examples
+                'examples': [
+                    {
+                        'issue_key': columns.issue_keys[row],
+                        'reason': audit_results[row]['criteria_results'][criterion].get('reason', 'N/A')
+                    }
+                    for row in rows
+                ]
             })
         
         return recommendations
     
     def _get_criterion_info(self, criterion_id: str) -> Dict:
         """Get criterion configuration info."""
-        # Check core compliance
-        if criterion_id in self.criteria_config.get('core_process_compliance', {}):
-            return self.criteria_config['core_process_compliance'][criterion_id]
-        # Check manual compliance
-        if criterion_id in self.criteria_config.get('manual_compliance', {}):
-            return self.criteria_config['manual_compliance'][criterion_id]
-        return {}
+        return self._criterion_info.get(criterion_id, {})
     
     def _generate_fix_suggestion(self, criterion_id: str, criterion_info: Dict) -> str:
         """Generate actionable fix suggestion for a criterion."""
@@ -432,105 +655,96 @@ class AuditReportBuilder:
         self,
         summary: Dict,
         audit_results: List[Dict],
-       recommendations: List[Dict]
+        recommendations: List[Dict]
     ) -> Path:
         """Save audit report as markdown file."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"JIRA_Compliance_Audit_{timestamp}.md"
         filepath = self.output_dir / filename
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            # Write header
-            f.write("# JIRA COMPLIANCE AUDIT REPORT\n\n")
-            f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            f.write("---\n\n")
-            
-            # Executive Summary
-            f.write("## A. Executive Summary\n\n")
-            f.write(f"- **Total Tickets Audited:** {summary['total_audited']}\n")
-            f.write(f"- **Fully Compliant:** {summary['compliant_count']} ({summary['compliant_count']/summary['total_audited']*100:.1f}%)\n")
-            f.write(f"- **Non-Compliant:** {summary['non_compliant_count']} ({summary['non_compliant_count']/summary['total_audited']*100:.1f}%)\n")
-            f.write(f"- **Zero-Tolerance Violations:** {summary['zero_tolerance_count']} ({summary['zero_tolerance_count']/summary['total_audited']*100:.1f}%)\n")
-            
-            if summary['zero_tolerance_violations']:
-                f.write("\n**Zero-Tolerance Violations by Criterion:**\n")
-                for criterion, tickets in summary['zero_tolerance_violations'].items():
-                    criterion_info = self._get_criterion_info(criterion)
-                    f.write(f"  - **{criterion_info.get('category', criterion)}:** {', '.join(tickets)}\n")
-            
-            f.write(f"\n- **Overall Compliance Rate:** {summary['compliance_rate']:.1f}%\n\n")
-            f.write("---\n\n")
-            
-            # Detailed Breakdown
-            f.write("## B. Detailed Ticket-by-Ticket Breakdown\n\n")
-            
-            for result in audit_results:
-                self._write_ticket_breakdown(f, result)
+        # Build the whole document in memory and write it in one call
+        buf = []
+        append = buf.append
+        
+        total = summary['total_audited']
+        pct = 100.0 / total if total else 0
+        
+        # Write header
+        append("# JIRA COMPLIANCE AUDIT REPORT\n\n")
+        append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        append("---\n\n")
+        
+        # Executive Summary
+        append("## A. Executive Summary\n\n")
+        append(f"- **Total Tickets Audited:** {total}\n")
+        append(f"- **Fully Compliant:** {summary['compliant_count']} ({summary['compliant_count'] * pct:.1f}%)\n")
+        append(f"- **Non-Compliant:** {summary['non_compliant_count']} ({summary['non_compliant_count'] * pct:.1f}%)\n")
+        append(f"- **Zero-Tolerance Violations:** {summary['zero_tolerance_count']} ({summary['zero_tolerance_count'] * pct:.1f}%)\n")
+        
+        if summary['zero_tolerance_violations']:
+            append("\n**Zero-Tolerance Violations by Criterion:**\n")
+            for criterion, tickets in summary['zero_tolerance_violations'].items():
+                append(f"  - **{self._category_by_id.get(criterion, criterion)}:** {', '.join(tickets)}\n")
+        
+        append(f"\n- **Overall Compliance Rate:** {summary['compliance_rate']:.1f}%\n\n")
+        append("---\n\n")
+        
+        # Detailed Breakdown
+        append("## B. Detailed Ticket-by-Ticket Breakdown\n\n")
+        
+        for result in audit_results:
+            self._write_ticket_breakdown(append, result)
+        
+        # Recommendations
+        append("## C. Recommendations\n\n")
+        
+        for i, rec in enumerate(recommendations, 1):
+            append(f"### {i}. {rec['category']} ({rec['failed_count']} tickets FAILED")
+            if rec['zero_tolerance']:
+                append(" - **Zero Tolerance**")
+            append(")\n\n")
             
-            # Recommendations
-            f.write("## C. Recommendations\n\n")
+            append(f"**Issue:** {rec['issue']}\n\n")
+            append(f"**Actionable Fix:**\n{rec['fix']}\n\n")
+            append(f"**Priority:** {rec['priority']}\n\n")
             
-            for i, rec in enumerate(recommendations, 1):
-                f.write(f"### {i}. {rec['category']} ({rec['failed_count']} tickets FAILED")
-                if rec['zero_tolerance']:
-                    f.write(" - **Zero Tolerance**")
-                f.write(")\n\n")
-                
-                f.write(f"**Issue:** {rec['issue']}\n\n")
-                f.write(f"**Actionable Fix:**\n{rec['fix']}\n\n")
-                f.write(f"**Priority:** {rec['priority']}\n\n")
-                
-                if rec['examples']:
-                    f.write("**Example Failures:**\n")
-                    for ex in rec['examples']:
-                        f.write(f"- `{ex['issue_key']}`: {ex['reason']}\n")
-                f.write("\n---\n\n")
+            if rec['examples']:
+                append("**Example Failures:**\n")
+                for ex in rec['examples']:
+                    append(f"- `{ex['issue_key']}`: {ex['reason']}\n")
+            append("\n---\n\n")
+        
+        filepath.write_text(''.join(buf), encoding='utf-8')
         
         return filepath
     
-    def _write_ticket_breakdown(self, f, result: Dict):
-        """Write ticket breakdown section to markdown file."""
-        f.write(f"### Ticket: {result['issue_key']}\n\n")
-        f.write(f"**Summary:** {result.get('ticket_summary', 'N/A')}\n\n")
-        f.write(f"**Overall Status:** ")
-        
-        if result['overall_status'] == 'COMPLIANT':
-            f.write("✅ **COMPLIANT**\n\n")
-        elif result['overall_status'] == 'NON-COMPLIANT':
-            f.write("❌ **NON-COMPLIANT**\n\n")
-        else:
-            f.write("🚫 **ZERO TOLERANCE FAIL**\n\n")
+    def _write_ticket_breakdown(self, append: Callable[[str], None], result: Dict):
+        """Append ticket breakdown section to the markdown buffer."""
+        append(f"### Ticket: {result['issue_key']}\n\n")
+        append(f"**Summary:** {result.get('ticket_summary', 'N/A')}\n\n")
+        append(f"**Overall Status:** {_OVERALL_MARK.get(result['overall_status'], _OVERALL_MARK['ERROR'])}\n\n")
         
         # Criteria table
-        f.write("| Criterion | Pass/Fail | Remarks |\n")
-        f.write("|-----------|-----------|----------|\n")
+        append("| Criterion | Pass/Fail | Remarks |\n")
+        append("|-----------|-----------|----------|\n")
         
+        category_by_id = self._category_by_id
         for criterion_id, check_result in result.get('criteria_results', {}).items():
-            criterion_info = self._get_criterion_info(criterion_id)
-            category = criterion_info.get('category', criterion_id)
+            category = category_by_id.get(criterion_id, criterion_id)
             
             if isinstance(check_result, dict):
-                status = check_result.get('status', 'Unknown')
-                reason = check_result.get('reason', 'N/A')
-                
-                if status == 'Pass':
-                    symbol = "✓"
-                elif status == 'Fail':
-                    symbol = "✗"
-                else:
-                    symbol = "—"
-                
-                f.write(f"| {category} | {symbol} | {reason} |\n")
+                symbol = _STATUS_SYMBOL.get(check_result.get('status'), "—")
+                append(f"| {category} | {symbol} | {check_result.get('reason', 'N/A')} |\n")
         
         # Zero tolerance violation note
-        f.write(f"\n**Zero Tolerance Violated?** ")
+        append(f"\n**Zero Tolerance Violated?** ")
         if result.get('zero_tolerance_violations'):
             violations = ', '.join([v['criterion'] for v in result['zero_tolerance_violations']])
-            f.write(f"**YES** - {violations}\n\n")
+            append(f"**YES** - {violations}\n\n")
         else:
-            f.write("No\n\n")
+            append("No\n\n")
         
-        f.write("---\n\n")
+        append("---\n\n")
     
     def _save_json_report(self, summary: Dict, audit_results: List[Dict], recommendations: List[Dict]) -> Path:
         """Save audit report as JSON file."""
@@ -545,12 +759,138 @@ class AuditReportBuilder:
             'recommendations': recommendations
         }
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            filepath.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
         
         return filepath
     
     def _save_excel_report(self, summary: Dict, audit_results: List[Dict], recommendations: List[Dict]) -> Path:
-        """Save audit report as Excel file (to be implemented)."""
-        # TODO: Implement Excel export
-        raise NotImplementedError("Excel export not yet implemented. Use markdown or JSON format.")
+        """
+        Save audit report as Excel file.
+        
+        Uses xlsxwriter in constant_memory mode: rows are flushed to disk as
+        they are written, so memory stays flat regardless of ticket count.
+        Each sheet is therefore written strictly top to bottom.
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"JIRA_Compliance_Audit_{timestamp}.xlsx"
+        filepath = self.output_dir / filename
+        
+        wb = xlsxwriter.Workbook(str(filepath), {'constant_memory': True})
+        try:
+            formats = {
+                'header': wb.add_format({
+                    'bold': True, 'font_color': '#FFFFFF', 'bg_color': '#1F4E79',
+                    'align': 'center', 'valign': 'vcenter', 'text_wrap': True, 'border': 1
+                }),
+                'wrap': wb.add_format({'text_wrap': True, 'valign': 'top'}),
+                'percent': wb.add_format({'num_format': '0.0"%"'}),
+                'COMPLIANT': wb.add_format({'bold': True, 'font_color': '#FFFFFF', 'bg_color': '#00B050'}),
+                'NON-COMPLIANT': wb.add_format({'bold': True, 'font_color': '#FFFFFF', 'bg_color': '#FF0000'}),
+                'ZERO_TOLERANCE_FAIL': wb.add_format({'bold': True, 'font_color': '#FFFFFF', 'bg_color': '#C00000'}),
+                'ERROR': wb.add_format({'bold': True, 'bg_color': '#FFC000'}),
+            }
+            
+            self._write_excel_summary(wb.add_worksheet("Summary"), summary, formats)
+            self._write_excel_details(wb.add_worksheet("Ticket Details"), audit_results, formats)
+            self._write_excel_recommendations(wb.add_worksheet("Recommendations"), recommendations, formats)
+        finally:
+            wb.close()
+        
+        return filepath
+    
+    def _write_excel_summary(self, ws, summary: Dict, formats: Dict):
+        """Write executive summary sheet."""
+        ws.set_column(0, 0, 32)
+        ws.set_column(1, 1, 60)
+        ws.write_row(0, 0, ("Metric", "Value"), formats['header'])
+        
+        rows = [
+            ("Generated", datetime.now().strftime('%Y-%m-%d %H:%M:%S')),
+            ("Total Tickets Audited", summary['total_audited']),
+            ("Fully Compliant", summary['compliant_count']),
+            ("Non-Compliant", summary['non_compliant_count']),
+            ("Zero-Tolerance Violations", summary['zero_tolerance_count']),
+        ]
+        for row, values in enumerate(rows, 1):
+            ws.write_row(row, 0, values)
+        
+        row = len(rows) + 1
+        ws.write(row, 0, "Overall Compliance Rate")
+        ws.write_number(row, 1, summary['compliance_rate'], formats['percent'])
+        
+        for criterion, tickets in summary['zero_tolerance_violations'].items():
+            row += 1
+            category = self._category_by_id.get(criterion, criterion)
+            ws.write_row(row, 0, (f"Zero Tolerance: {category}", ', '.join(tickets)), formats['wrap'])
+    
+    def _write_excel_details(self, ws, audit_results: List[Dict], formats: Dict):
+        """Write one row per ticket with a status column per criterion."""
+        criterion_ids = self._criterion_ids
+        headers = (
+            ["Issue Key", "Summary", "Jira Status", "MIT", "Overall Status"]
+            + [self._category_by_id.get(cid, cid) for cid in criterion_ids]
+            + ["Failure Reasons"]
+        )
+        
+        ws.set_column(0, 0, 14)
+        ws.set_column(1, 1, 40)
+        ws.set_column(2, 4, 18)
+        ws.set_column(5, 4 + len(criterion_ids), 12)
+        ws.set_column(5 + len(criterion_ids), 5 + len(criterion_ids), 60)
+        ws.freeze_panes(1, 1)
+        ws.write_row(0, 0, headers, formats['header'])
+        
+        status_col = 4
+        for row, result in enumerate(audit_results, 1):
+            criteria_results = result.get('criteria_results', {})
+            overall_status = result['overall_status']
+            
+            statuses = []
+            reasons = []
+            for cid in criterion_ids:
+                check_result = criteria_results.get(cid)
+                if check_result is None:
+                    statuses.append('')
+                    continue
+                statuses.append(check_result.get('status', ''))
+                if check_result.get('status') == 'Fail':
+                    reasons.append(f"{cid}: {check_result.get('reason', 'N/A')}")
+            if 'error' in result:
+                reasons.append(f"Fetch error: {result['error']}")
+            
+            ws.write_row(row, 0, (
+                result['issue_key'],
+                result.get('ticket_summary', ''),
+                result.get('ticket_status', ''),
+                'Yes' if result.get('is_mit') else 'No',
+            ))
+            ws.write(row, status_col, overall_status, formats.get(overall_status))
+            ws.write_row(row, status_col + 1, statuses)
+            ws.write(row, status_col + 1 + len(criterion_ids), '; '.join(reasons), formats['wrap'])
+    
+    def _write_excel_recommendations(self, ws, recommendations: List[Dict], formats: Dict):
+        """Write grouped recommendations sheet."""
+        headers = ("#", "Category", "Failed Count", "Zero Tolerance", "Priority", "Issue", "Actionable Fix", "Example Failures")
+        
+        ws.set_column(0, 0, 5)
+        ws.set_column(1, 1, 28)
+        ws.set_column(2, 4, 14)
+        ws.set_column(5, 7, 50)
+        ws.write_row(0, 0, headers, formats['header'])
+        
+        for row, rec in enumerate(recommendations, 1):
+            examples = '\n'.join(f"{ex['issue_key']}: {ex['reason']}" for ex in rec['examples'])
+            ws.write_row(row, 0, (
+                row,
+                rec['category'],
+                rec['failed_count'],
+                'Yes' if rec['zero_tolerance'] else 'No',
+                rec['priority'],
+                rec['issue'],
+                rec['fix'],
+                examples,
+            ), formats['wrap'])
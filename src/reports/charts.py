@@ -3,13 +3,10 @@ Chart Generation Module
 Provides utilities for creating Excel charts using openpyxl.
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Optional, Tuple
 
-from openpyxl.chart import (
-    BarChart, LineChart, PieChart, AreaChart, Reference, Series
-)
+from openpyxl.chart import BarChart, LineChart, PieChart, AreaChart, Reference
 from openpyxl.chart.label import DataLabelList
-from openpyxl.chart.layout import Layout, ManualLayout
 from openpyxl.worksheet.worksheet import Worksheet
 
 from src.utils.logger import get_logger
@@ -29,6 +26,62 @@ class ChartBuilder:
         'professional': 26
     }
     
+    # Fallback style per chart kind when the preset name is unknown
+    _DEFAULT_STYLE = {'bar': 10, 'line': 10, 'pie': 11, 'area': 10}
+    
+    # (width, height) in cm
+    _SIZE_STD = (15, 10)
+    _SIZE_PIE = (12, 10)
+    
+    @staticmethod
+    def _add_data(
+        chart,
+        ws: Worksheet,
+        data_range: Tuple[int, int, int, int],
+        categories_range: Tuple[int, int, int, int]
+    ) -> None:
+        """
+        Attach data series (titles from the first row) and categories to a chart.
+        
+        Args:
+            chart: openpyxl chart to populate
+            ws: Worksheet containing data
+            data_range: (min_col, min_row, max_col, max_row) for data
+            categories_range: (min_col, min_row, max_col, max_row) for categories
+        """
+        data = Reference(ws,
+                        min_col=data_range[0], min_row=data_range[1],
+                        max_col=data_range[2], max_row=data_range[3])
+        categories = Reference(ws,
+                              min_col=categories_range[0], min_row=categories_range[1],
+                              max_col=categories_range[2], max_row=categories_range[3])
+        
+        chart.add_data(data, titles_from_data=True)
+        chart.set_categories(categories)
+    
+    @staticmethod
+    def _apply_titles(
+        chart,
+        title: Optional[str],
+        x_title: Optional[str],
+        y_title: Optional[str]
+    ) -> None:
+        """
+        Set chart and axis titles, leaving openpyxl defaults for empty values.
+        
+        Args:
+            chart: openpyxl chart with x_axis/y_axis
+            title: Chart title
+            x_title: X-axis title
+            y_title: Y-axis title
+        """
+        if title:
+            chart.title = title
+        if x_title:
+            chart.x_axis.title = x_title
+        if y_title:
+            chart.y_axis.title = y_title
+    
     @staticmethod
     def create_bar_chart(
         ws: Worksheet,
@@ -60,33 +113,19 @@ class ChartBuilder:
         """
         chart = BarChart()
         chart.type = "bar" if horizontal else "col"
-        chart.style = ChartBuilder.STYLES.get(style, 10)
+        chart.style = ChartBuilder.STYLES.get(style) or ChartBuilder._DEFAULT_STYLE['bar']
         
         if stacked:
             chart.grouping = "stacked"
             chart.overlap = 100
         
-        if title:
-            chart.title = title
-        if x_title:
-            chart.x_axis.title = x_title
-        if y_title:
-            chart.y_axis.title = y_title
+        ChartBuilder._apply_titles(chart, title, x_title, y_title)
         
         # Add data
-        data = Reference(ws, 
-                        min_col=data_range[0], min_row=data_range[1],
-                        max_col=data_range[2], max_row=data_range[3])
-        categories = Reference(ws,
-                              min_col=categories_range[0], min_row=categories_range[1],
-                              max_col=categories_range[2], max_row=categories_range[3])
-        
-        chart.add_data(data, titles_from_data=True)
-        chart.set_categories(categories)
+        ChartBuilder._add_data(chart, ws, data_range, categories_range)
         
         # Set size
-        chart.width = 15
-        chart.height = 10
+        chart.width, chart.height = ChartBuilder._SIZE_STD
         
         return chart
     
@@ -118,25 +157,12 @@ class ChartBuilder:
             Configured LineChart object
         """
         chart = LineChart()
-        chart.style = ChartBuilder.STYLES.get(style, 10)
+        chart.style = ChartBuilder.STYLES.get(style) or ChartBuilder._DEFAULT_STYLE['line']
         
-        if title:
-            chart.title = title
-        if x_title:
-            chart.x_axis.title = x_title
-        if y_title:
-            chart.y_axis.title = y_title
+        ChartBuilder._apply_titles(chart, title, x_title, y_title)
         
         # Add data
-        data = Reference(ws,
-                        min_col=data_range[0], min_row=data_range[1],
-                        max_col=data_range[2], max_row=data_range[3])
-        categories = Reference(ws,
-                              min_col=categories_range[0], min_row=categories_range[1],
-                              max_col=categories_range[2], max_row=categories_range[3])
-        
-        chart.add_data(data, titles_from_data=True)
-        chart.set_categories(categories)
+        ChartBuilder._add_data(chart, ws, data_range, categories_range)
         
         # Apply smooth lines if requested
         if smooth:
@@ -144,8 +170,7 @@ class ChartBuilder:
                 series.smooth = True
         
         # Set size
-        chart.width = 15
-        chart.height = 10
+        chart.width, chart.height = ChartBuilder._SIZE_STD
         
         return chart
     
@@ -171,31 +196,19 @@ class ChartBuilder:
             Configured PieChart object
         """
         chart = PieChart()
-        chart.style = ChartBuilder.STYLES.get(style, 11)
+        chart.style = ChartBuilder.STYLES.get(style) or ChartBuilder._DEFAULT_STYLE['pie']
         
         if title:
             chart.title = title
         
         # Add data
-        data = Reference(ws,
-                        min_col=data_range[0], min_row=data_range[1],
-                        max_col=data_range[2], max_row=data_range[3])
-        categories = Reference(ws,
-                              min_col=categories_range[0], min_row=categories_range[1],
-                              max_col=categories_range[2], max_row=categories_range[3])
-        
-        chart.add_data(data, titles_from_data=True)
-        chart.set_categories(categories)
+        ChartBuilder._add_data(chart, ws, data_range, categories_range)
         
         # Show data labels with percentages
-        chart.dataLabels = DataLabelList()
-        chart.dataLabels.showPercent = True
-        chart.dataLabels.showVal = False
-        chart.dataLabels.showCatName = True
+        chart.dataLabels = DataLabelList(showPercent=True, showVal=False, showCatName=True)
         
         # Set size
-        chart.width = 12
-        chart.height = 10
+        chart.width, chart.height = ChartBuilder._SIZE_PIE
         
         return chart
     
@@ -227,32 +240,18 @@ class ChartBuilder:
             Configured AreaChart object
         """
         chart = AreaChart()
-        chart.style = ChartBuilder.STYLES.get(style, 10)
+        chart.style = ChartBuilder.STYLES.get(style) or ChartBuilder._DEFAULT_STYLE['area']
         
         if stacked:
             chart.grouping = "stacked"
         
-        if title:
-            chart.title = title
-        if x_title:
-            chart.x_axis.title = x_title
-        if y_title:
-            chart.y_axis.title = y_title
+        ChartBuilder._apply_titles(chart, title, x_title, y_title)
         
         # Add data
-        data = Reference(ws,
-                        min_col=data_range[0], min_row=data_range[1],
-                        max_col=data_range[2], max_row=data_range[3])
-        categories = Reference(ws,
-                              min_col=categories_range[0], min_row=categories_range[1],
-                              max_col=categories_range[2], max_row=categories_range[3])
-        
-        chart.add_data(data, titles_from_data=True)
-        chart.set_categories(categories)
+        ChartBuilder._add_data(chart, ws, data_range, categories_range)
         
         # Set size
-        chart.width = 15
-        chart.height = 10
+        chart.width, chart.height = ChartBuilder._SIZE_STD
         
         return chart
     
@@ -286,24 +285,15 @@ class ChartBuilder:
         chart.y_axis.title = "Story Points"
         chart.x_axis.title = "Sprint"
         
-        # Data: committed and completed
-        data = Reference(ws,
-                        min_col=committed_col,
-                        min_row=start_row - 1,  # Include header
-                        max_col=completed_col,
-                        max_row=start_row + num_sprints - 1)
-        
-        # Categories: sprint names
-        cats = Reference(ws,
-                        min_col=sprint_col,
-                        min_row=start_row,
-                        max_row=start_row + num_sprints - 1)
-        
-        chart.add_data(data, titles_from_data=True)
-        chart.set_categories(cats)
+        # Data: committed and completed (header row included); categories: sprint names
+        end_row = start_row + num_sprints - 1
+        ChartBuilder._add_data(
+            chart, ws,
+            (committed_col, start_row - 1, completed_col, end_row),
+            (sprint_col, start_row, sprint_col, end_row)
+        )
         
-        chart.width = 15
-        chart.height = 10
+        chart.width, chart.height = ChartBuilder._SIZE_STD
         
         return chart
     
@@ -336,28 +326,19 @@ class ChartBuilder:
         chart.y_axis.title = "Remaining Points"
         chart.x_axis.title = "Day"
         
-        # Data: remaining and ideal
-        data = Reference(ws,
-                        min_col=remaining_col,
-                        min_row=start_row - 1,
-                        max_col=ideal_col,
-                        max_row=start_row + num_days - 1)
-        
-        # Categories: dates
-        cats = Reference(ws,
-                        min_col=date_col,
-                        min_row=start_row,
-                        max_row=start_row + num_days - 1)
-        
-        chart.add_data(data, titles_from_data=True)
-        chart.set_categories(cats)
+        # Data: remaining and ideal (header row included); categories: dates
+        end_row = start_row + num_days - 1
+        ChartBuilder._add_data(
+            chart, ws,
+            (remaining_col, start_row - 1, ideal_col, end_row),
+            (date_col, start_row, date_col, end_row)
+        )
         
         # Make ideal line dashed
         if len(chart.series) > 1:
             chart.series[1].graphicalProperties.line.dashStyle = "dash"
         
-        chart.width = 15
-        chart.height = 10
+        chart.width, chart.height = ChartBuilder._SIZE_STD
         
         return chart
     
@@ -386,25 +367,16 @@ class ChartBuilder:
         chart.style = 11
         chart.title = "Status Distribution"
         
-        data = Reference(ws,
-                        min_col=count_col,
-                        min_row=start_row - 1,
-                        max_row=start_row + num_statuses - 1)
-        
-        cats = Reference(ws,
-                        min_col=status_col,
-                        min_row=start_row,
-                        max_row=start_row + num_statuses - 1)
-        
-        chart.add_data(data, titles_from_data=True)
-        chart.set_categories(cats)
+        end_row = start_row + num_statuses - 1
+        ChartBuilder._add_data(
+            chart, ws,
+            (count_col, start_row - 1, count_col, end_row),
+            (status_col, start_row, status_col, end_row)
+        )
         
         # Show percentages
-        chart.dataLabels = DataLabelList()
-        chart.dataLabels.showPercent = True
-        chart.dataLabels.showCatName = True
+        chart.dataLabels = DataLabelList(showPercent=True, showCatName=True)
         
-        chart.width = 12
-        chart.height = 10
+        chart.width, chart.height = ChartBuilder._SIZE_PIE
         
         return chart
@@ -3,14 +3,13 @@ Compliance Report Builder Module
 Generates JIRA compliance audit reports tracking employee weekly process adherence.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-from openpyxl.utils import get_column_letter
-from openpyxl.worksheet.worksheet import Worksheet
+import xlsxwriter
 
 from src.compliance.checks import (
     StatusHygieneCheck,
@@ -21,6 +20,11 @@ from src.compliance.checks import (
     LifecycleCheck,
     ZeroToleranceCheck
 )
+from src.compliance.evaluation import (
+    evaluate_employee_week,
+    fetch_employee_issues_bulk,
+    required_fields
+)
 from src.jira_client import JiraClient
 from src.database.connection import get_session
 from src.database.models import JiraUser
@@ -30,6 +34,28 @@ from src.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _iso_weeks_between(start_day: str, end_day: str) -> Tuple[datetime, ...]:
+    """
+    Monday dates (ISO week starts, at midnight) from the week containing start_day through end_day.
+    
+    Keyed on YYYY-MM-DD strings rather than datetimes so that calls for the
+    same days (e.g. end_date=datetime.now()) share a cache entry.
+    """
+    weeks = []
+    start = datetime.fromisoformat(start_day)
+    end = datetime.fromisoformat(end_day)
+    
+    # Go to the Monday of the week containing start_day
+    current = start - timedelta(days=start.weekday())
+    
+    while current <= end:
+        weeks.append(current)
+        current += timedelta(days=7)
+    
+    return tuple(weeks)
+
+
 class ComplianceReportBuilder:
     """
     Builds JIRA Compliance Reports tracking employee weekly process adherence.
@@ -63,19 +89,37 @@ class ComplianceReportBuilder:
         "Auditor's Notes"
     ]
     
-    # Styling constants
-    HEADER_FILL = PatternFill(start_color="1F4E79", end_color="1F4E79", fill_type="solid")
-    HEADER_FONT = Font(name='Calibri', size=12, bold=True, color="FFFFFF")
-    DATA_FONT = Font(name='Calibri', size=11)
-    PASS_FILL = PatternFill(start_color="00B050", end_color="00B050", fill_type="solid")
-    FAIL_FILL = PatternFill(start_color="FF0000", end_color="FF0000", fill_type="solid")
-    BORDER = Border(
-        left=Side(style='thin', color='000000'),
-        right=Side(style='thin', color='000000'),
-        top=Side(style='thin', color='000000'),
-        bottom=Side(style='thin', color='000000')
+    # Record keys for the compliance check columns C-I (same order as COLUMNS)
+    CHECK_FIELDS = (
+        'status_hygiene',
+        'cancellation',
+        'update_frequency',
+        'role_ownership',
+        'documentation',
+        'lifecycle',
+        'zero_tolerance'
     )
     
+    # Cell formats (xlsxwriter properties), registered once per workbook
+    _CELL_BASE = {'font_name': 'Calibri', 'font_size': 11, 'border': 1, 'border_color': '#000000'}
+    CELL_FORMATS = {
+        'header': {
+            **_CELL_BASE, 'font_size': 12, 'bold': True, 'font_color': '#FFFFFF',
+            'bg_color': '#1F4E79', 'align': 'center', 'valign': 'vcenter', 'text_wrap': True
+        },
+        'text': {**_CELL_BASE, 'align': 'left'},
+        'date': {**_CELL_BASE, 'align': 'center', 'num_format': 'YYYY-MM-DD'},
+        'Pass': {**_CELL_BASE, 'bold': True, 'font_color': '#FFFFFF', 'bg_color': '#00B050', 'align': 'center'},
+        'Fail': {**_CELL_BASE, 'bold': True, 'font_color': '#FFFFFF', 'bg_color': '#FF0000', 'align': 'center'},
+        'notes': {**_CELL_BASE, 'align': 'left', 'text_wrap': True},
+    }
+    
+    # Column widths in sheet order (A..K)
+    COLUMN_WIDTHS = [20, 15, 22, 28, 20, 28, 32, 18, 22, 22, 50]
+    
+    # Concurrent weekly fetches (JIRA requests in flight at once)
+    MAX_FETCH_WORKERS = 8
+    
     def __init__(self, jira_client: JiraClient, output_dir: str = "./outputs"):
         """
         Initialize compliance report builder.
@@ -99,6 +143,9 @@ class ComplianceReportBuilder:
             'zero_tolerance': ZeroToleranceCheck()
         }
         
+        # Request only the JIRA fields the checks read instead of '*all'
+        self._jira_fields = required_fields(self.checks)
+        
         logger.info("Compliance report builder initialized")
     
     def generate_report(
@@ -120,112 +167,112 @@ class ComplianceReportBuilder:
         """
         logger.info(f"Generating compliance report: {start_date.date()} to {end_date.date()}")
         
-        # Create workbook
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "JIRA Compliance Report"
-        
-        # Write headers
-        self._write_headers(ws)
-        
         # Get employees and weeks
         employees = self._get_active_employees(team_id)
         weeks = self._get_iso_weeks(start_date, end_date)
         
         logger.info(f"Processing {len(employees)} employees across {len(weeks)} weeks")
         
-        # Process each employee-week combination
-        row = 2
+        # One bulk fetch per week (weeks fetched concurrently); each week is evaluated
+        # as soon as it is fetched, so only the small per-employee records are kept
+        weekly_records = []
+        if employees and weeks:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_FETCH_WORKERS, len(weeks))) as executor:
+                weekly_records = list(executor.map(
+                    lambda week_start: self._evaluate_week(employees, week_start),
+                    weeks
+                ))
+        
+        # Employee/week order for the sequential sheet writes
+        records = [
+            week_records[employee.account_id]
+            for employee in employees
+            for week_records in weekly_records
+        ]
+        
+        # Generate filename
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        output_path = self.output_dir / f"JIRA_Compliance_Report_{timestamp}.xlsx"
+        
+        # constant_memory flushes each row to disk once the next row starts,
+        # so the sheet is written strictly top to bottom
         processed_count = 0
         skipped_count = 0
         
-        for employee in employees:
-            for week_start in weeks:
-                compliance_data = self._evaluate_employee_week(employee, week_start)
-                
+        wb = xlsxwriter.Workbook(str(output_path), {'constant_memory': True})
+        try:
+            formats = {name: wb.add_format(props) for name, props in self.CELL_FORMATS.items()}
+            ws = wb.add_worksheet("JIRA Compliance Report")
+            
+            self._apply_formatting(ws)
+            self._write_headers(ws, formats)
+            
+            row = 1
+            for compliance_data in records:
                 if compliance_data:  # Skip weeks with no activity
-                    self._write_data_row(ws, row, compliance_data)
+                    self._write_data_row(ws, row, compliance_data, formats)
                     row += 1
                     processed_count += 1
                 else:
                     skipped_count += 1
-        
-        # Apply formatting
-        self._apply_formatting(ws, row - 1)
-        
-        # Generate filename and save
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        output_path = self.output_dir / f"JIRA_Compliance_Report_{timestamp}.xlsx"
-        wb.save(output_path)
+        finally:
+            wb.close()
         
         logger.info(f"Compliance report saved: {output_path}")
         logger.info(f"Processed: {processed_count} records, Skipped: {skipped_count} (no activity)")
         
         return str(output_path)
     
-    def _write_headers(self, ws: Worksheet):
+    def _write_headers(self, ws, formats: Dict):
         """Write column headers with formatting."""
-        for col, header in enumerate(self.COLUMNS, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = self.HEADER_FONT
-            cell.fill = self.HEADER_FILL
-            cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-            cell.border = self.BORDER
+        ws.write_row(0, 0, self.COLUMNS, formats['header'])
     
-    def _write_data_row(self, ws: Worksheet, row: int, data: Dict[str, Any]):
+    def _write_data_row(self, ws, row: int, data: Dict[str, Any], formats: Dict):
         """Write single compliance data row."""
         # Column A: Employee Name
-        cell = ws.cell(row=row, column=1, value=data['employee_name'])
-        cell.font = self.DATA_FONT
-        cell.alignment = Alignment(horizontal='left')
-        cell.border = self.BORDER
+        ws.write_string(row, 0, data['employee_name'], formats['text'])
         
         # Column B: Week Start Date
-        cell = ws.cell(row=row, column=2, value=data['week_start'])
-        cell.font = self.DATA_FONT
-        cell.number_format = 'YYYY-MM-DD'
-        cell.alignment = Alignment(horizontal='center')
-        cell.border = self.BORDER
+        ws.write_datetime(row, 1, data['week_start'], formats['date'])
         
-        # Columns C-I: Compliance checks
-        compliance_fields = [
-            'status_hygiene',
-            'cancellation',
-            'update_frequency',
-            'role_ownership',
-            'documentation',
-            'lifecycle',
-            'zero_tolerance'
-        ]
+        # Columns C-I: Compliance checks (one row write, same format)
+        ws.write_row(row, 2, [data[field] for field in self.CHECK_FIELDS], formats['text'])
         
-        for col, field in enumerate(compliance_fields, 3):
-            cell = ws.cell(row=row, column=col, value=data[field])
-            cell.font = self.DATA_FONT
-            cell.alignment = Alignment(horizontal='left')
-            cell.border = self.BORDER
+        # Column J: Overall Compliance (conditional fill)
+        overall = data['overall_compliance']
+        ws.write_string(row, 9, overall, formats['Pass' if overall == 'Pass' else 'Fail'])
         
-        # Column J: Overall Compliance
-        overall_cell = ws.cell(row=row, column=10, value=data['overall_compliance'])
-        overall_cell.font = Font(name='Calibri', size=11, bold=True, color="FFFFFF")
-        overall_cell.alignment = Alignment(horizontal='center')
-        overall_cell.border = self.BORDER
+        # Column K: Auditor's Notes
+        ws.write_string(row, 10, data['auditor_notes'], formats['notes'])
+    
+    def _evaluate_week(self, employees: List[JiraUser], week_start: datetime) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch one week's issues and evaluate every employee for that week.
         
-        # Apply conditional formatting
-        if data['overall_compliance'] == 'Pass':
-            overall_cell.fill = self.PASS_FILL
-        else:
-            overall_cell.fill = self.FAIL_FILL
+        The raw issues (with changelogs) are dropped once evaluated.
         
-        # Column K: Auditor's Notes
-        notes_cell = ws.cell(row=row, column=11, value=data['auditor_notes'])
-        notes_cell.font = self.DATA_FONT
-        notes_cell.alignment = Alignment(horizontal='left', wrap_text=True)
-        notes_cell.border = self.BORDER
+        Args:
+            employees: JiraUser objects
+            week_start: Monday of the week
+            
+        Returns:
+            Mapping of account ID to compliance data (None if no activity)
+        """
+        issues_by_account = fetch_employee_issues_bulk(
+            self.jira, employees, week_start, week_start + timedelta(days=6), self._jira_fields
+        )
+        return {
+            employee.account_id: self._evaluate_employee_week(
+                employee, week_start, issues_by_account.get(employee.account_id, [])
+            )
+            for employee in employees
+        }
     
     def _evaluate_employee_week(
         self, 
         employee: JiraUser, 
-        week_start: datetime
+        week_start: datetime,
+        issues: List[Dict[str, Any]]
     ) -> Optional[Dict[str, Any]]:
         """
         Evaluate compliance for employee during specific week.
@@ -233,150 +280,31 @@ class ComplianceReportBuilder:
         Args:
             employee: JiraUser object
             week_start: Monday of the week
+            issues: Employee's issues updated during the week
             
         Returns:
             Compliance data dictionary or None if no activity
         """
-        week_end = week_start + timedelta(days=6)
-        
-        # Get employee's issues for the week
-        issues = self._get_employee_issues(employee, week_start, week_end)
-        
         if not issues:
             logger.debug(f"No activity for {employee.display_name} week of {week_start.date()}")
             return None
         
         logger.debug(f"Evaluating {employee.display_name} week of {week_start.date()} ({len(issues)} issues)")
         
-        # Run all compliance checks
-        results = {}
-        for check_name, check in self.checks.items():
-            try:
-                # New checks return dict, legacy builder expects str
-                check_result = check.evaluate(issues, employee)
-                results[check_name] = self._map_result_to_legacy_format(check_result, check_name)
-            except Exception as e:
-                logger.error(f"Check {check_name} failed for {employee.display_name}: {e}")
-                results[check_name] = "Error"
-        
-        # Calculate overall compliance
-        overall = self._calculate_overall_compliance(results)
-        
-        # Generate auditor notes
-        notes = self._generate_auditor_notes(results)
-        
-        return {
-            'employee_name': employee.display_name,
-            'week_start': week_start,
-            'status_hygiene': results['status_hygiene'],
-            'cancellation': results['cancellation'],
-            'update_frequency': results['update_frequency'],
-            'role_ownership': results['role_ownership'],
-            'documentation': results['documentation'],
-            'lifecycle': results['lifecycle'],
-            'zero_tolerance': results['zero_tolerance'],
-            'overall_compliance': overall,
-            'auditor_notes': notes
-        }
-
-    def _map_result_to_legacy_format(self, result: Dict[str, Any], check_name: str) -> str:
-        """Map new dictionary result to legacy string format."""
-        status = result.get('status', 'NA')
-        reason = result.get('reason', '')
-        
-        if status == 'Pass':
-            if check_name == 'cancellation':
-                return "No" # cancellations: No means Pass (no unauthorized cancellations)
-            if check_name == 'zero_tolerance':
-                return "No" # zero_tolerance: No means Pass (no violations)
-            return "Yes"
-            
-        elif status == 'Fail':
-            if check_name == 'cancellation':
-                return f"Yes - {reason}" # cancellation: Yes means Fail (violation found)
-            if check_name == 'zero_tolerance':
-                return "Yes" # zero_tolerance: Yes means Fail
-            return f"No - {reason}"
-            
-        return "NA"
-        
         return {
             'employee_name': employee.display_name,
             'week_start': week_start,
-            'status_hygiene': results['status_hygiene'],
-            'cancellation': results['cancellation'],
-            'update_frequency': results['update_frequency'],
-            'role_ownership': results['role_ownership'],
-            'documentation': results['documentation'],
-            'lifecycle': results['lifecycle'],
-            'zero_tolerance': results['zero_tolerance'],
-            'overall_compliance': overall,
-            'auditor_notes': notes
+            **evaluate_employee_week(self.checks, employee, issues)
         }
     
-    def _calculate_overall_compliance(self, results: Dict[str, str]) -> str:
-        """
-        Calculate overall pass/fail based on all checks.
-        
-        Logic: Fail if ANY check is "No" or contains "No -" or zero-tolerance violation
-        """
-        for check_name, result in results.items():
-            # Check for "No" or "No - [reason]"
-            if result.startswith("No"):
-                return "Fail"
-            
-            # Zero-tolerance: "Yes" means violation found (inverted logic)
-            if check_name == 'zero_tolerance' and result == "Yes":
-                return "Fail"
-            
-            # Error in check
-            if result == "Error":
-                return "Fail"
-        
-        return "Pass"
-    
-    def _generate_auditor_notes(self, results: Dict[str, str]) -> str:
-        """Generate human-readable notes from compliance results."""
-        issues = []
-        
-        for check_name, result in results.items():
-            # Extract reasons from "No - [reason]" format
-            if result.startswith("No -"):
-                issues.append(result[5:])  # Extract reason after "No - "
-            elif result.startswith("Yes -") and check_name == 'cancellation':
-                # Cancellation has "Yes - [details]" format
-                issues.append(result[6:])
-            elif result == "No" and check_name == 'cancellation':
-                # No cancellation is good, skip
-                pass
-            elif result == "No":
-                # Generic "No" without reason
-                check_display = check_name.replace('_', ' ').title()
-                issues.append(f"{check_display} failed")
-            elif check_name == 'zero_tolerance' and result == "Yes":
-                issues.append("Zero-tolerance violation detected")
-            elif result == "Error":
-                issues.append(f"{check_name.replace('_', ' ').title()} check error")
-        
-        return "; ".join(issues) if issues else "All checks passed"
-    
-    def _apply_formatting(self, ws: Worksheet, last_row: int):
-        """Apply final formatting to worksheet."""
+    def _apply_formatting(self, ws):
+        """Apply sheet layout (frozen header, column widths); must run before rows are written."""
         # Freeze header row
-        ws.freeze_panes = 'A2'
+        ws.freeze_panes(1, 0)
         
-        # Set column widths
-        ws.column_dimensions['A'].width = 20  # Employee Name
-        ws.column_dimensions['B'].width = 15  # Week Start Date
-        ws.column_dimensions['C'].width = 22  # Status Hygiene
-        ws.column_dimensions['D'].width = 28  # Cancellation
-        ws.column_dimensions['E'].width = 20  # Updates
-        ws.column_dimensions['F'].width = 28  # Roles
-        ws.column_dimensions['G'].width = 32  # Documentation
-        ws.column_dimensions['H'].width = 18  # Lifecycle
-        ws.column_dimensions['I'].width = 22  # Zero-Tolerance
-        ws.column_dimensions['J'].width = 22  # Overall Compliance
-        ws.column_dimensions['K'].width = 50  # Auditor's Notes
+        # Set column widths (Employee Name .. Auditor's Notes)
+        for col, width in enumerate(self.COLUMN_WIDTHS):
+            ws.set_column(col, col, width)
     
     def _get_active_employees(self, team_id: Optional[int]) -> List[JiraUser]:
         """
@@ -400,8 +328,11 @@ class ComplianceReportBuilder:
             
             employees = query.order_by(JiraUser.display_name).all()
             
-            logger.info(f"Found {len(employees)} active employees")
-            return employees
+            # Detach before the session commits so attributes stay loaded after close
+            session.expunge_all()
+        
+        logger.info(f"Found {len(employees)} active employees")
+        return employees
     
     def _get_iso_weeks(self, start_date: datetime, end_date: datetime) -> List[datetime]:
         """
@@ -414,58 +345,10 @@ class ComplianceReportBuilder:
         Returns:
             List of datetime objects (all Mondays)
         """
-        weeks = []
-        
-        # Go to the Monday of the week containing start_date
-        current = start_date - timedelta(days=start_date.weekday())
-        
-        while current <= end_date:
-            weeks.append(current)
-            current += timedelta(days=7)
+        weeks = list(_iso_weeks_between(start_date.date().isoformat(), end_date.date().isoformat()))
         
         logger.debug(f"Generated {len(weeks)} weeks from {weeks[0].date()} to {weeks[-1].date()}")
         return weeks
-    
-    def _get_employee_issues(
-        self, 
-        employee: JiraUser, 
-        week_start: datetime, 
-        week_end: datetime
-    ) -> List[Dict[str, Any]]:
-        """
-        Fetch employee's JIRA issues for the week.
-        
-        Args:
-            employee: JiraUser object
-            week_start: Week start (Monday)
-            week_end: Week end (Sunday)
-            
-        Returns:
-            List of issue dictionaries with full data
-        """
-        try:
-            # Build JQL query for employee's issues in the week
-            # Issues where employee is assignee OR reporter, updated in the week
-            jql = f'''
-                (assignee = "{employee.account_id}" OR reporter = "{employee.account_id}")
-                AND updated >= "{week_start.strftime('%Y-%m-%d')}"
-                AND updated <= "{week_end.strftime('%Y-%m-%d')}"
-            '''
-            
-            # Fetch issues with changelog and comments expanded
-            issues = list(self.jira.fetch_issues(
-                jql=jql.strip(),
-                fields=['*all'],
-                expand=['changelog', 'renderedFields'],
-                max_results=100
-            ))
-            
-            logger.debug(f"Fetched {len(issues)} issues for {employee.display_name}")
-            return issues
-            
-        except Exception as e:
-            logger.error(f"Failed to fetch issues for {employee.display_name}: {e}")
-            return []
 
 
 def generate_compliance_report(
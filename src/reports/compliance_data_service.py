@@ -3,8 +3,11 @@ Compliance Data Service Module
 Provides live compliance data for dashboard display.
 """
 
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Any, Dict, List, Optional
+import json
 import time
 
 from src.compliance.checks import (
@@ -16,6 +19,11 @@ from src.compliance.checks import (
     LifecycleCheck,
     ZeroToleranceCheck
 )
+from src.compliance.evaluation import (
+    evaluate_employee_week,
+    fetch_employee_issues_bulk,
+    required_fields
+)
 from src.jira_client import JiraClient
 from src.database.connection import get_session
 from src.database.models import JiraUser
@@ -31,12 +39,13 @@ class ComplianceDataService:
     Provides JSON-formatted compliance data with caching to reduce JIRA API calls.
     """
     
-    def __init__(self, jira_client: JiraClient):
+    def __init__(self, jira_client: JiraClient, cache_path: Optional[str] = None):
         """
         Initialize compliance data service.
         
         Args:
             jira_client: Authenticated JIRA client instance
+            cache_path: Optional JSON file persisting fresh cache entries across restarts
         """
         self.jira = jira_client
         
@@ -51,9 +60,18 @@ class ComplianceDataService:
             'zero_tolerance': ZeroToleranceCheck()
         }
         
-        # Simple in-memory cache
-        self._cache = {}
+        # Request only the JIRA fields the checks read instead of '*all'
+        self._jira_fields = required_fields(self.checks)
+        
+        # Bounded LRU cache of cache_key -> (data, timestamp)
+        self._cache = OrderedDict()
         self._cache_ttl = 300  # 5 minutes
+        self._cache_maxsize = 128
+        self._cache_path = Path(cache_path) if cache_path else None
+        self._load_cache()
+        
+        # Active employees per team_id (same TTL; avoids a DB query per week_offset)
+        self._employees_cache = {}
         
         logger.info("Compliance data service initialized")
     
@@ -80,6 +98,7 @@ class ComplianceDataService:
             cached_data, cached_time = self._cache[cache_key]
             if time.time() - cached_time < self._cache_ttl:
                 logger.debug(f"Returning cached data for {cache_key}")
+                self._cache.move_to_end(cache_key)
                 return cached_data
         
         logger.info(f"Generating live compliance data: team_id={team_id}, week_offset={week_offset}")
@@ -92,15 +111,22 @@ class ComplianceDataService:
         # Get active employees
         employees = self._get_active_employees(team_id)
         
+        # Fetch the week's issues for all employees at once, grouped by account ID
+        issues_by_account = fetch_employee_issues_bulk(
+            self.jira, employees, week_start, week_end, self._jira_fields
+        )
+        
         # Generate compliance data
         compliance_data = []
         for employee in employees:
-            record = self._evaluate_employee_week(employee, week_start, week_end)
+            record = self._evaluate_employee_week(
+                employee, week_start, issues_by_account.get(employee.account_id, [])
+            )
             if record:  # Only include if employee had activity
                 compliance_data.append(record)
         
         # Cache the results
-        self._cache[cache_key] = (compliance_data, time.time())
+        self._store_cache(cache_key, compliance_data)
         
         logger.info(f"Generated {len(compliance_data)} compliance records")
         return compliance_data
@@ -127,7 +153,7 @@ class ComplianceDataService:
     
     def _get_active_employees(self, team_id: Optional[int]) -> List[JiraUser]:
         """
-        Get list of active employees.
+        Get list of active employees (cached per team for the cache TTL).
         
         Args:
             team_id: Optional team filter
@@ -135,6 +161,11 @@ class ComplianceDataService:
         Returns:
             List of JiraUser objects
         """
+        if team_id in self._employees_cache:
+            cached_employees, cached_time = self._employees_cache[team_id]
+            if time.time() - cached_time < self._cache_ttl:
+                return cached_employees
+        
         with get_session() as session:
             query = session.query(JiraUser).filter(JiraUser.active == True)
             
@@ -144,14 +175,19 @@ class ComplianceDataService:
             
             employees = query.order_by(JiraUser.display_name).all()
             
-            logger.debug(f"Found {len(employees)} active employees")
-            return employees
+            # Detach before the session commits so attributes stay loaded after close
+            session.expunge_all()
+        
+        self._employees_cache[team_id] = (employees, time.time())
+        
+        logger.debug(f"Found {len(employees)} active employees")
+        return employees
     
     def _evaluate_employee_week(
         self,
         employee: JiraUser,
         week_start: datetime,
-        week_end: datetime
+        issues: List[Dict[str, Any]]
     ) -> Optional[Dict[str, Any]]:
         """
         Evaluate compliance for employee during specific week.
@@ -159,137 +195,87 @@ class ComplianceDataService:
         Args:
             employee: JiraUser object
             week_start: Monday of the week
-            week_end: Sunday of the week
+            issues: Employee's issues updated during the week
             
         Returns:
             Compliance data dictionary or None if no activity
         """
-        # Get employee's issues for the week
-        issues = self._get_employee_issues(employee, week_start, week_end)
-        
         if not issues:
             logger.debug(f"No activity for {employee.display_name} week of {week_start.date()}")
             return None
         
         logger.debug(f"Evaluating {employee.display_name} week of {week_start.date()} ({len(issues)} issues)")
         
-        # Run all compliance checks
-        results = {}
-        for check_name, check in self.checks.items():
-            try:
-                results[check_name] = check.evaluate(issues, employee)
-            except Exception as e:
-                logger.error(f"Check {check_name} failed for {employee.display_name}: {e}")
-                results[check_name] = "Error"
-        
-        # Calculate overall compliance
-        overall = self._calculate_overall_compliance(results)
-        
-        # Generate auditor notes
-        notes = self._generate_auditor_notes(results)
-        
-        # Return JSON-serializable dictionary
         return {
             'employee_name': employee.display_name,
             'week_start_date': week_start.strftime('%Y-%m-%d'),
-            'status_hygiene': results['status_hygiene'],
-            'cancellation': results['cancellation'],
-            'update_frequency': results['update_frequency'],
-            'role_ownership': results['role_ownership'],
-            'documentation': results['documentation'],
-            'lifecycle': results['lifecycle'],
-            'zero_tolerance': results['zero_tolerance'],
-            'overall_compliance': overall,
-            'auditor_notes': notes
+            **evaluate_employee_week(self.checks, employee, issues)
         }
     
-    def _get_employee_issues(
-        self,
-        employee: JiraUser,
-        week_start: datetime,
-        week_end: datetime
-    ) -> List[Dict[str, Any]]:
-        """
-        Fetch employee's JIRA issues for the week.
+    def _store_cache(self, cache_key: str, data: List[Dict[str, Any]]):
+        """Insert into the LRU cache, evicting the least recently used entries over the cap."""
+        self._cache[cache_key] = (data, time.time())
+        self._cache.move_to_end(cache_key)
         
-        Args:
-            employee: JiraUser object
-            week_start: Week start (Monday)
-            week_end: Week end (Sunday)
-            
-        Returns:
-            List of issue dictionaries with full data
-        """
-        try:
-            # Build JQL query for employee's issues in the week
-            jql = f'''
-                (assignee = "{employee.account_id}" OR reporter = "{employee.account_id}")
-                AND updated >= "{week_start.strftime('%Y-%m-%d')}"
-                AND updated <= "{week_end.strftime('%Y-%m-%d')}"
-            '''
-            
-            # Fetch issues with changelog and comments expanded
-            issues = list(self.jira.fetch_issues(
-                jql=jql.strip(),
-                fields=['*all'],
-                expand=['changelog', 'renderedFields'],
-                max_results=100
-            ))
-            
-            logger.debug(f"Fetched {len(issues)} issues for {employee.display_name}")
-            return issues
-            
-        except Exception as e:
-            logger.error(f"Failed to fetch issues for {employee.display_name}: {e}")
-            return []
+        while len(self._cache) > self._cache_maxsize:
+            self._cache.popitem(last=False)
+        
+        self._save_cache()
     
-    def _calculate_overall_compliance(self, results: Dict[str, str]) -> str:
-        """
-        Calculate overall pass/fail based on all checks.
+    def _load_cache(self):
+        """Load unexpired entries from the cache file, if configured."""
+        if not self._cache_path or not self._cache_path.exists():
+            return
         
-        Logic: Fail if ANY check is "No" or contains "No -" or zero-tolerance violation
-        """
-        for check_name, result in results.items():
-            # Check for "No" or "No - [reason]"
-            if result.startswith("No"):
-                return "Fail"
-            
-            # Zero-tolerance: "Yes" means violation found (inverted logic)
-            if check_name == 'zero_tolerance' and result == "Yes":
-                return "Fail"
-            
-            # Error in check
-            if result == "Error":
-                return "Fail"
+        try:
+            entries = json.loads(self._cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable compliance cache {self._cache_path}: {e}")
+            return
+        
+        if not isinstance(entries, dict):
+            logger.warning(f"Ignoring malformed compliance cache {self._cache_path}")
+            return
+        
+        # Keep only well-formed [records, timestamp] entries
+        valid = {
+            cache_key: entry
+            for cache_key, entry in entries.items()
+            if isinstance(entry, list) and len(entry) == 2
+            and isinstance(entry[0], list)
+            and isinstance(entry[1], (int, float)) and not isinstance(entry[1], bool)
+        }
+        if len(valid) < len(entries):
+            logger.warning(f"Skipped {len(entries) - len(valid)} malformed compliance cache entries")
         
-        return "Pass"
+        now = time.time()
+        for cache_key, (data, cached_time) in sorted(valid.items(), key=lambda item: item[1][1]):
+            if now - cached_time < self._cache_ttl:
+                self._cache[cache_key] = (data, cached_time)
+        
+        logger.debug(f"Loaded {len(self._cache)} cached compliance entries")
     
-    def _generate_auditor_notes(self, results: Dict[str, str]) -> str:
-        """Generate human-readable notes from compliance results."""
-        issues = []
-        
-        for check_name, result in results.items():
-            # Extract reasons from "No - [reason]" format
-            if result.startswith("No -"):
-                issues.append(result[5:])  # Extract reason after "No - "
-            elif result.startswith("Yes -") and check_name == 'cancellation':
-                # Cancellation has "Yes - [details]" format
-                issues.append(result[6:])
-            elif result == "No" and check_name == 'cancellation':
-                # No cancellation is good, skip
-                pass
-            elif result == "No":
-                # Generic "No" without reason
-                check_display = check_name.replace('_', ' ').title()
-                issues.append(f"{check_display} failed")
-            elif check_name == 'zero_tolerance' and result == "Yes":
-                issues.append("Zero-tolerance violation detected")
-            elif result == "Error":
-                issues.append(f"{check_name.replace('_', ' ').title()} check error")
-        
-        return "; ".join(issues) if issues else "All checks passed"
+    def _save_cache(self):
+        """Write unexpired entries to the cache file, if configured."""
+        if not self._cache_path:
+            return
+        
+        now = time.time()
+        entries = {
+            cache_key: [data, cached_time]
+            for cache_key, (data, cached_time) in self._cache.items()
+            if now - cached_time < self._cache_ttl
+        }
+        
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._cache_path.write_text(json.dumps(entries), encoding='utf-8')
+        except OSError as e:
+            logger.warning(f"Failed to write compliance cache {self._cache_path}: {e}")
     
     def clear_cache(self):
         """Clear the data cache."""
         self._cache.clear()
+        self._employees_cache.clear()
+        self._save_cache()
         logger.info("Cache cleared")
@@ -3,22 +3,25 @@ Excel Dashboard Builder Module
 Creates professional Excel dashboards with multiple sheets, charts, and formatting.
 """
 
+import warnings
 from datetime import datetime 
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import (
-    Font, Alignment, Border, Side, PatternFill, NamedStyle
+    Font, Alignment, Border, Side, PatternFill
 )
 from openpyxl.utils import get_column_letter
 from openpyxl.utils.dataframe import dataframe_to_rows
-from openpyxl.worksheet.table import Table, TableStyleInfo
+from openpyxl.worksheet.table import Table, TableColumn, TableStyleInfo
 from openpyxl.worksheet.worksheet import Worksheet
 
 from src.config_manager import ConfigManager
 from src.database.connection import get_session
+from src.database.models import Team
 from src.database.queries import QueryHelpers
 from src.reports.charts import ChartBuilder
 from src.utils.logger import get_logger
@@ -38,6 +41,16 @@ class ExcelBuilder:
     SUBHEADER_FONT = Font(bold=True, color="FFFFFF", size=10)
     ALT_ROW_FILL = PatternFill(start_color="D6E3F8", end_color="D6E3F8", fill_type="solid")
     
+    # Shared cell styles (one instance each, assigned directly to cells)
+    SUMMARY_TITLE_FONT = Font(bold=True, size=16, color="1F4E79")
+    TITLE_FONT = Font(bold=True, size=14, color="1F4E79")
+    TIMESTAMP_FONT = Font(italic=True, size=9, color="666666")
+    TEAM_HEADER_FONT = Font(bold=True, size=12)
+    NO_DATA_FONT = Font(italic=True, color="666666")
+    METRIC_LABEL_FONT = Font(bold=True)
+    RIGHT_ALIGN = Alignment(horizontal='right')
+    CENTER_ALIGN = Alignment(horizontal='center')
+    
     BORDER = Border(
         left=Side(style='thin', color='000000'),
         right=Side(style='thin', color='000000'),
@@ -63,111 +76,128 @@ class ExcelBuilder:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             self.output_path = output_dir / f"jira_dashboard_{timestamp}.xlsx"
         
-        self.workbook = Workbook()
-        self._setup_styles()
-        
-        # Remove default sheet
-        if 'Sheet' in self.workbook.sheetnames:
-            del self.workbook['Sheet']
+        # Write-only: rows stream to disk as appended instead of being held as cells
+        self.workbook = Workbook(write_only=True)
         
         logger.info(f"Excel builder initialized, output: {self.output_path}")
     
-    def _setup_styles(self) -> None:
-        """Setup named styles for the workbook."""
-        # Header style
-        header_style = NamedStyle(name="header")
-        header_style.font = self.HEADER_FONT
-        header_style.fill = self.HEADER_FILL
-        header_style.alignment = Alignment(horizontal='center', vertical='center')
-        
-        # Number style
-        number_style = NamedStyle(name="number")
-        number_style.number_format = '#,##0'
-        number_style.alignment = Alignment(horizontal='right')
-        
-        # Percent style
-        percent_style = NamedStyle(name="percent")
-        percent_style.number_format = '0.0%'
-        percent_style.alignment = Alignment(horizontal='right')
-        
-        # Date style
-        date_style = NamedStyle(name="date")
-        date_style.number_format = 'YYYY-MM-DD'
-        date_style.alignment = Alignment(horizontal='center')
-        
-        # Add styles to workbook if not present
-        for style in [header_style, number_style, percent_style, date_style]:
-            if style.name not in self.workbook.named_styles:
-                self.workbook.add_named_style(style)
-    
-    def generate_dashboard(self, team_id: int = None) -> str:
+    def generate_dashboard(self, team_id: int = None, stream: BinaryIO = None) -> Union[str, BinaryIO]:
         """
         Generate complete dashboard workbook.
         
         Args:
             team_id: Optional team filter
+            stream: Optional binary file-like object (e.g. BytesIO) to write the
+                workbook to instead of the output path
             
         Returns:
-            Path to generated file
+            Path to generated file, or the stream if one was given
         """
         logger.info("Generating dashboard...")
         
         with get_session() as session:
             queries = QueryHelpers(session)
             
+            # Teams shown on every sheet (queried once per dashboard)
+            teams = [t for t in queries.get_all_teams() if team_id is None or t.id == team_id]
+            
             # Create sheets
-            self._create_executive_summary(queries, team_id)
-            self._create_velocity_sheet(queries, team_id)
-            self._create_sprint_analysis(queries, team_id)
-            self._create_priority_sheet(queries, team_id)
-            self._create_aging_sheet(queries, team_id)
-            self._create_time_tracking_sheet(queries, team_id)
+            self._create_executive_summary(queries, teams, team_id)
+            self._create_velocity_sheet(queries, teams, team_id)
+            self._create_sprint_analysis(queries, teams, team_id)
+            self._create_priority_sheet(queries, teams, team_id)
+            self._create_aging_sheet(queries, teams, team_id)
+            self._create_time_tracking_sheet(queries, teams, team_id)
         
         # Save workbook
+        if stream is not None:
+            self.workbook.save(stream)
+            logger.info("Dashboard written to stream")
+            return stream
+        
         self.workbook.save(self.output_path)
         logger.info(f"Dashboard saved to: {self.output_path}")
         
         return str(self.output_path)
     
-    def _create_executive_summary(self, queries: QueryHelpers, team_id: int = None) -> None:
+    def _cell(
+        self,
+        ws: Worksheet,
+        value: Any,
+        font: Font = None,
+        fill: PatternFill = None,
+        alignment: Alignment = None
+    ) -> WriteOnlyCell:
+        """Create a styled cell for appending to a write-only sheet."""
+        cell = WriteOnlyCell(ws, value=value)
+        if font:
+            cell.font = font
+        if fill:
+            cell.fill = fill
+        if alignment:
+            cell.alignment = alignment
+        return cell
+    
+    def _title(
+        self,
+        ws: Worksheet,
+        range_ref: str,
+        text: str,
+        font: Font = None,
+        alignment: Alignment = None
+    ) -> List[WriteOnlyCell]:
+        """Merge a title range and create its row; only the top-left cell holds the value and style."""
+        ws.merged_cells.add(range_ref)
+        return [self._cell(ws, text, font=font or self.TITLE_FONT, alignment=alignment)]
+    
+    def _header_cells(self, ws: Worksheet, headers: List[str], alignment: Alignment = None) -> List[WriteOnlyCell]:
+        """Create a row of table header cells."""
+        return [
+            self._cell(ws, header, font=self.HEADER_FONT, fill=self.HEADER_FILL, alignment=alignment)
+            for header in headers
+        ]
+    
+    def _create_executive_summary(self, queries: QueryHelpers, teams: List[Team], team_id: int = None) -> None:
         """Create executive summary sheet."""
         ws = self.workbook.create_sheet("Executive Summary")
         
+        # Column widths (written with the sheet header, before any rows)
+        ws.column_dimensions['A'].width = 30
+        ws.column_dimensions['B'].width = 15
+        ws.column_dimensions['C'].width = 12
+        ws.column_dimensions['D'].width = 12
+        ws.column_dimensions['E'].width = 15
+        
         # Title
-        ws.merge_cells('A1:F1')
-        title_cell = ws['A1']
-        title_cell.value = "Jira Dashboard - Executive Summary"
-        title_cell.font = Font(bold=True, size=16, color="1F4E79")
-        title_cell.alignment = Alignment(horizontal='center')
+        rows = [self._title(
+            ws, 'A1:F1', "Jira Dashboard - Executive Summary",
+            font=self.SUMMARY_TITLE_FONT,
+            alignment=self.CENTER_ALIGN
+        )]
         
         # Generation timestamp
-        ws['A2'] = f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        ws['A2'].font = Font(italic=True, size=9, color="666666")
-        
-        row = 4
+        rows.append([self._cell(
+            ws, f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            font=self.TIMESTAMP_FONT
+        )])
+        rows.append([])
         
         # Key Metrics section
-        ws[f'A{row}'] = "Key Metrics"
-        ws[f'A{row}'].font = Font(bold=True, size=14, color="1F4E79")
-        row += 2
+        rows.append([self._cell(ws, "Key Metrics", font=self.TITLE_FONT)])
+        rows.append([])
         
         # Get metrics data
         if team_id:
-            daily_metrics = queries.get_daily_metrics(team_id, days=30)
             time_tracking = queries.get_time_tracking_summary(team_id)
             velocity_data = queries.get_team_velocity(team_id, sprint_count=5)
         else:
-            teams = queries.get_all_teams()
-            daily_metrics = []
             velocity_data = []
             time_tracking = {'total_estimated_hours': 0, 'total_spent_hours': 0}
-            
-            for team in teams:
-                daily_metrics.extend(queries.get_daily_metrics(team.id, days=30))
         
-        # Calculate summary stats
-        total_created = sum(m.get('tickets_created', 0) for m in daily_metrics)
-        total_resolved = sum(m.get('tickets_resolved', 0) for m in daily_metrics)
+        # Calculate summary stats (summed in the database)
+        totals = queries.get_ticket_totals(team_id, days=30)
+        total_created = totals['created']
+        total_resolved = totals['resolved']
         
         # Metrics table
         metrics = [
@@ -179,38 +209,33 @@ class ExcelBuilder:
         ]
         
         for metric_name, metric_value in metrics:
-            ws[f'A{row}'] = metric_name
-            ws[f'A{row}'].font = Font(bold=True)
-            ws[f'B{row}'] = metric_value
-            ws[f'B{row}'].alignment = Alignment(horizontal='right')
-            row += 1
+            rows.append([
+                self._cell(ws, metric_name, font=self.METRIC_LABEL_FONT),
+                self._cell(ws, metric_value, alignment=self.RIGHT_ALIGN)
+            ])
         
-        row += 2
+        rows.extend([[], []])
         
         # Velocity section
+        chart = None
         if velocity_data:
-            ws[f'A{row}'] = "Recent Sprint Velocity"
-            ws[f'A{row}'].font = Font(bold=True, size=14, color="1F4E79")
-            row += 2
+            rows.append([self._cell(ws, "Recent Sprint Velocity", font=self.TITLE_FONT)])
+            rows.append([])
             
             # Headers
             headers = ['Sprint', 'Committed', 'Completed', 'Velocity', 'Completion %']
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=row, column=col, value=header)
-                cell.font = self.HEADER_FONT
-                cell.fill = self.HEADER_FILL
-                cell.alignment = Alignment(horizontal='center')
-            row += 1
+            rows.append(self._header_cells(ws, headers, alignment=self.CENTER_ALIGN))
             
             # Data rows
-            data_start_row = row
+            data_start_row = len(rows) + 1
             for sprint in reversed(velocity_data):  # Show oldest first
-                ws.cell(row=row, column=1, value=sprint.get('sprint_name', ''))
-                ws.cell(row=row, column=2, value=sprint.get('points_committed', 0))
-                ws.cell(row=row, column=3, value=sprint.get('points_completed', 0))
-                ws.cell(row=row, column=4, value=sprint.get('velocity', 0))
-                ws.cell(row=row, column=5, value=f"{sprint.get('completion_rate', 0)}%")
-                row += 1
+                rows.append([
+                    sprint.get('sprint_name', ''),
+                    sprint.get('points_committed', 0),
+                    sprint.get('points_completed', 0),
+                    sprint.get('velocity', 0),
+                    f"{sprint.get('completion_rate', 0)}%"
+                ])
             
             # Add velocity chart
             if len(velocity_data) > 1:
@@ -222,113 +247,99 @@ class ExcelBuilder:
                     completed_col=3,
                     num_sprints=len(velocity_data)
                 )
-                ws.add_chart(chart, f"G{data_start_row - 1}")
+                anchor = f"G{data_start_row - 1}"
         
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 30
-        ws.column_dimensions['B'].width = 15
-        ws.column_dimensions['C'].width = 12
-        ws.column_dimensions['D'].width = 12
-        ws.column_dimensions['E'].width = 15
+        for sheet_row in rows:
+            ws.append(sheet_row)
+        
+        if chart:
+            ws.add_chart(chart, anchor)
     
-    def _create_velocity_sheet(self, queries: QueryHelpers, team_id: int = None) -> None:
+    def _create_velocity_sheet(self, queries: QueryHelpers, teams: List[Team], team_id: int = None) -> None:
         """Create velocity analysis sheet."""
         ws = self.workbook.create_sheet("Velocity Analysis")
         
-        # Title
-        ws.merge_cells('A1:E1')
-        ws['A1'] = "Team Velocity Analysis"
-        ws['A1'].font = Font(bold=True, size=14, color="1F4E79")
+        # Adjust column widths
+        for col in range(1, 7):
+            ws.column_dimensions[get_column_letter(col)].width = 15
         
-        row = 3
+        # Title
+        rows = [self._title(ws, 'A1:E1', "Team Velocity Analysis"), []]
         
-        # Get all teams or specific team
-        if team_id:
-            teams = [queries.session.query(queries.get_all_teams.__self__).get(team_id)]
-        else:
-            teams = queries.get_all_teams()
+        # One query for every team's sprints
+        velocities = queries.get_team_velocity_bulk([team.id for team in teams], sprint_count=10)
         
         for team in teams:
-            if not team:
-                continue
-            
             # Team header
-            ws[f'A{row}'] = team.team_name
-            ws[f'A{row}'].font = Font(bold=True, size=12)
-            row += 1
+            rows.append([self._cell(ws, team.team_name, font=self.TEAM_HEADER_FONT)])
             
             # Get velocity data
-            velocity_data = queries.get_team_velocity(team.id, sprint_count=10)
+            velocity_data = velocities[team.id]
             
             if velocity_data:
                 # Headers
                 headers = ['Sprint', 'Start Date', 'End Date', 'Committed', 'Completed', 'Velocity']
-                for col, header in enumerate(headers, 1):
-                    cell = ws.cell(row=row, column=col, value=header)
-                    cell.font = self.HEADER_FONT
-                    cell.fill = self.HEADER_FILL
-                row += 1
+                rows.append(self._header_cells(ws, headers))
                 
                 # Data
                 for sprint in reversed(velocity_data):
-                    ws.cell(row=row, column=1, value=sprint.get('sprint_name', ''))
-                    ws.cell(row=row, column=2, value=sprint.get('start_date').strftime('%Y-%m-%d') if sprint.get('start_date') else '')
-                    ws.cell(row=row, column=3, value=sprint.get('end_date').strftime('%Y-%m-%d') if sprint.get('end_date') else '')
-                    ws.cell(row=row, column=4, value=sprint.get('points_committed', 0))
-                    ws.cell(row=row, column=5, value=sprint.get('points_completed', 0))
-                    ws.cell(row=row, column=6, value=sprint.get('velocity', 0))
-                    row += 1
+                    rows.append([
+                        sprint.get('sprint_name', ''),
+                        sprint.get('start_date').strftime('%Y-%m-%d') if sprint.get('start_date') else '',
+                        sprint.get('end_date').strftime('%Y-%m-%d') if sprint.get('end_date') else '',
+                        sprint.get('points_committed', 0),
+                        sprint.get('points_completed', 0),
+                        sprint.get('velocity', 0)
+                    ])
                 
                 # Average velocity
                 avg_velocity = sum(s.get('velocity', 0) for s in velocity_data) / len(velocity_data)
-                ws[f'E{row}'] = "Average:"
-                ws[f'E{row}'].font = Font(bold=True)
-                ws[f'F{row}'] = round(avg_velocity, 1)
-                ws[f'F{row}'].font = Font(bold=True)
+                rows.append([
+                    None, None, None, None,
+                    self._cell(ws, "Average:", font=self.METRIC_LABEL_FONT),
+                    self._cell(ws, round(avg_velocity, 1), font=self.METRIC_LABEL_FONT)
+                ])
             else:
-                ws[f'A{row}'] = "No sprint data available"
-                ws[f'A{row}'].font = Font(italic=True, color="666666")
+                rows.append([self._cell(ws, "No sprint data available", font=self.NO_DATA_FONT)])
             
-            row += 2
+            rows.append([])
         
-        # Adjust column widths
-        for col in range(1, 7):
-            ws.column_dimensions[get_column_letter(col)].width = 15
+        for sheet_row in rows:
+            ws.append(sheet_row)
     
-    def _create_sprint_analysis(self, queries: QueryHelpers, team_id: int = None) -> None:
+    def _create_sprint_analysis(self, queries: QueryHelpers, teams: List[Team], team_id: int = None) -> None:
         """Create sprint analysis sheet."""
         ws = self.workbook.create_sheet("Sprint Analysis")
         
-        # Title
-        ws.merge_cells('A1:G1')
-        ws['A1'] = "Sprint Analysis & Burndown"
-        ws['A1'].font = Font(bold=True, size=14, color="1F4E79")
+        # Adjust column widths
+        ws.column_dimensions['A'].width = 20
+        ws.column_dimensions['B'].width = 40
         
-        row = 3
+        # Title
+        rows = [self._title(ws, 'A1:G1', "Sprint Analysis & Burndown"), []]
         
-        # Get teams
-        if team_id:
-            teams = [t for t in queries.get_all_teams() if t.id == team_id]
-        else:
-            teams = queries.get_all_teams()
+        # Recent sprints for every team, then the detailed metrics of the last 3 per team
+        velocities = queries.get_team_velocity_bulk([team.id for team in teams], sprint_count=5)
+        sprint_metrics_by_id = queries.get_sprint_metrics_bulk([
+            sprint['sprint_id']
+            for velocity_data in velocities.values()
+            for sprint in velocity_data[:3]
+        ])
         
         for team in teams:
             # Team header
-            ws[f'A{row}'] = team.team_name
-            ws[f'A{row}'].font = Font(bold=True, size=12)
-            row += 2
+            rows.append([self._cell(ws, team.team_name, font=self.TEAM_HEADER_FONT)])
+            rows.append([])
             
             # Get recent sprints
-            velocity_data = queries.get_team_velocity(team.id, sprint_count=5)
+            velocity_data = velocities[team.id]
             
             for sprint in velocity_data[:3]:  # Show last 3 sprints in detail
-                sprint_metrics = queries.get_sprint_metrics(sprint['sprint_id'])
+                sprint_metrics = sprint_metrics_by_id.get(sprint['sprint_id'])
                 
                 if sprint_metrics:
                     # Sprint name
-                    ws[f'A{row}'] = sprint_metrics.get('sprint_name', 'Unknown Sprint')
-                    ws[f'A{row}'].font = Font(bold=True)
-                    row += 1
+                    rows.append([self._cell(ws, sprint_metrics.get('sprint_name', 'Unknown Sprint'), font=self.METRIC_LABEL_FONT)])
                     
                     # Metrics grid
                     metrics = [
@@ -339,176 +350,150 @@ class ExcelBuilder:
                         ('Completed Points', sprint_metrics.get('completed_points', 0)),
                         ('Completion %', f"{sprint_metrics.get('completion_percentage', 0)}%"),
                     ]
-                    
-                    for metric_name, metric_value in metrics:
-                        ws[f'A{row}'] = metric_name
-                        ws[f'B{row}'] = metric_value
-                        row += 1
+                    rows.extend([metric_name, metric_value] for metric_name, metric_value in metrics)
                     
                     if sprint_metrics.get('goal'):
-                        ws[f'A{row}'] = "Goal"
-                        ws[f'B{row}'] = sprint_metrics.get('goal', '')[:100]
-                        row += 1
+                        rows.append(["Goal", sprint_metrics.get('goal', '')[:100]])
                     
-                    row += 1
+                    rows.append([])
             
-            row += 1
+            rows.append([])
         
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 20
-        ws.column_dimensions['B'].width = 40
+        for sheet_row in rows:
+            ws.append(sheet_row)
     
-    def _create_priority_sheet(self, queries: QueryHelpers, team_id: int = None) -> None:
+    def _create_priority_sheet(self, queries: QueryHelpers, teams: List[Team], team_id: int = None) -> None:
         """Create priority distribution sheet."""
         ws = self.workbook.create_sheet("Priority Analysis")
         
-        # Title
-        ws.merge_cells('A1:E1')
-        ws['A1'] = "Priority Distribution"
-        ws['A1'].font = Font(bold=True, size=14, color="1F4E79")
+        # Adjust column widths
+        for col in range(1, 5):
+            ws.column_dimensions[get_column_letter(col)].width = 15
         
-        row = 3
+        # Title
+        rows = [self._title(ws, 'A1:E1', "Priority Distribution"), []]
+        charts = []
         
-        # Get teams
-        if team_id:
-            teams = [t for t in queries.get_all_teams() if t.id == team_id]
-        else:
-            teams = queries.get_all_teams()
+        priorities = queries.get_priority_distribution_bulk([team.id for team in teams])
         
         for team in teams:
             # Team header
-            ws[f'A{row}'] = team.team_name
-            ws[f'A{row}'].font = Font(bold=True, size=12)
-            row += 1
+            rows.append([self._cell(ws, team.team_name, font=self.TEAM_HEADER_FONT)])
             
             # Get priority distribution
-            priority_data = queries.get_priority_distribution(team.id)
+            priority_data = priorities[team.id]
             
             if priority_data:
                 # Headers
                 headers = ['Priority', 'Total', 'Open', 'Resolved']
-                for col, header in enumerate(headers, 1):
-                    cell = ws.cell(row=row, column=col, value=header)
-                    cell.font = self.HEADER_FONT
-                    cell.fill = self.HEADER_FILL
-                row += 1
+                rows.append(self._header_cells(ws, headers))
                 
-                data_start_row = row
+                data_start_row = len(rows) + 1
                 
                 # Data
                 for item in priority_data:
-                    ws.cell(row=row, column=1, value=item.get('priority', ''))
-                    ws.cell(row=row, column=2, value=item.get('total_count', 0))
-                    ws.cell(row=row, column=3, value=item.get('open_count', 0))
-                    ws.cell(row=row, column=4, value=item.get('resolved_count', 0))
-                    row += 1
+                    rows.append([
+                        item.get('priority', ''),
+                        item.get('total_count', 0),
+                        item.get('open_count', 0),
+                        item.get('resolved_count', 0)
+                    ])
                 
                 # Add pie chart
                 if len(priority_data) > 1:
                     chart = ChartBuilder.create_pie_chart(
                         ws,
-                        data_range=(3, data_start_row - 1, 3, row - 1),  # Open count
-                        categories_range=(1, data_start_row, 1, row - 1),  # Priority names
+                        data_range=(3, data_start_row - 1, 3, len(rows)),  # Open count
+                        categories_range=(1, data_start_row, 1, len(rows)),  # Priority names
                         title="Open Issues by Priority"
                     )
-                    ws.add_chart(chart, f"F{data_start_row - 1}")
+                    charts.append((chart, f"F{data_start_row - 1}"))
+                
+                rows.append([])
             else:
-                ws[f'A{row}'] = "No priority data available"
-                ws[f'A{row}'].font = Font(italic=True, color="666666")
+                rows.append([self._cell(ws, "No priority data available", font=self.NO_DATA_FONT)])
             
-            row += 2
+            rows.append([])
         
-        # Adjust column widths
-        for col in range(1, 5):
-            ws.column_dimensions[get_column_letter(col)].width = 15
+        for sheet_row in rows:
+            ws.append(sheet_row)
+        
+        for chart, anchor in charts:
+            ws.add_chart(chart, anchor)
     
-    def _create_aging_sheet(self, queries: QueryHelpers, team_id: int = None) -> None:
+    def _create_aging_sheet(self, queries: QueryHelpers, teams: List[Team], team_id: int = None) -> None:
         """Create ticket aging sheet."""
         ws = self.workbook.create_sheet("Ticket Aging")
         
+        # Adjust column widths
+        ws.column_dimensions['A'].width = 15
+        ws.column_dimensions['B'].width = 12
+        
         # Title
-        ws.merge_cells('A1:D1')
-        ws['A1'] = "Ticket Aging Analysis"
-        ws['A1'].font = Font(bold=True, size=14, color="1F4E79")
+        rows = [self._title(ws, 'A1:D1', "Ticket Aging Analysis"), []]
+        charts = []
         
-        row = 3
-        
-        # Get teams
-        if team_id:
-            teams = [t for t in queries.get_all_teams() if t.id == team_id]
-        else:
-            teams = queries.get_all_teams()
+        aging = queries.get_ticket_aging_bulk([team.id for team in teams])
         
         for team in teams:
             # Team header
-            ws[f'A{row}'] = team.team_name
-            ws[f'A{row}'].font = Font(bold=True, size=12)
-            row += 1
+            rows.append([self._cell(ws, team.team_name, font=self.TEAM_HEADER_FONT)])
             
             # Get aging data
-            aging_data = queries.get_ticket_aging(team.id)
+            aging_data = aging[team.id]
             
             if aging_data:
                 # Headers
                 headers = ['Age Bucket', 'Count']
-                for col, header in enumerate(headers, 1):
-                    cell = ws.cell(row=row, column=col, value=header)
-                    cell.font = self.HEADER_FONT
-                    cell.fill = self.HEADER_FILL
-                row += 1
+                rows.append(self._header_cells(ws, headers))
                 
-                data_start_row = row
+                data_start_row = len(rows) + 1
                 
                 # Data
                 for item in aging_data:
-                    ws.cell(row=row, column=1, value=item.get('bucket', ''))
-                    ws.cell(row=row, column=2, value=item.get('count', 0))
-                    row += 1
+                    rows.append([item.get('bucket', ''), item.get('count', 0)])
                 
                 # Add bar chart
                 if len(aging_data) > 1:
                     chart = ChartBuilder.create_bar_chart(
                         ws,
-                        data_range=(2, data_start_row - 1, 2, row - 1),
-                        categories_range=(1, data_start_row, 1, row - 1),
+                        data_range=(2, data_start_row - 1, 2, len(rows)),
+                        categories_range=(1, data_start_row, 1, len(rows)),
                         title="Ticket Age Distribution"
                     )
-                    ws.add_chart(chart, f"D{data_start_row - 1}")
+                    charts.append((chart, f"D{data_start_row - 1}"))
+                
+                rows.append([])
             else:
-                ws[f'A{row}'] = "No aging data available"
-                ws[f'A{row}'].font = Font(italic=True, color="666666")
+                rows.append([self._cell(ws, "No aging data available", font=self.NO_DATA_FONT)])
             
-            row += 2
+            rows.append([])
         
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 15
-        ws.column_dimensions['B'].width = 12
+        for sheet_row in rows:
+            ws.append(sheet_row)
+        
+        for chart, anchor in charts:
+            ws.add_chart(chart, anchor)
     
-    def _create_time_tracking_sheet(self, queries: QueryHelpers, team_id: int = None) -> None:
+    def _create_time_tracking_sheet(self, queries: QueryHelpers, teams: List[Team], team_id: int = None) -> None:
         """Create time tracking sheet."""
         ws = self.workbook.create_sheet("Time Tracking")
         
-        # Title
-        ws.merge_cells('A1:D1')
-        ws['A1'] = "Time Tracking Summary"
-        ws['A1'].font = Font(bold=True, size=14, color="1F4E79")
+        # Adjust column widths
+        ws.column_dimensions['A'].width = 25
+        ws.column_dimensions['B'].width = 15
         
-        row = 3
+        # Title
+        rows = [self._title(ws, 'A1:D1', "Time Tracking Summary"), []]
         
-        # Get teams
-        if team_id:
-            teams = [t for t in queries.get_all_teams() if t.id == team_id]
-        else:
-            teams = queries.get_all_teams()
+        time_tracking = queries.get_time_tracking_summary_bulk([team.id for team in teams])
         
         for team in teams:
             # Team header
-            ws[f'A{row}'] = team.team_name
-            ws[f'A{row}'].font = Font(bold=True, size=12)
-            row += 1
+            rows.append([self._cell(ws, team.team_name, font=self.TEAM_HEADER_FONT)])
             
             # Get time tracking data
-            time_data = queries.get_time_tracking_summary(team.id)
+            time_data = time_tracking[team.id]
             
             if time_data:
                 metrics = [
@@ -519,19 +504,16 @@ class ExcelBuilder:
                 ]
                 
                 for metric_name, metric_value in metrics:
-                    ws[f'A{row}'] = metric_name
-                    ws[f'A{row}'].font = Font(bold=True)
-                    ws[f'B{row}'] = metric_value
-                    row += 1
+                    rows.append([self._cell(ws, metric_name, font=self.METRIC_LABEL_FONT), metric_value])
+                
+                rows.append([])
             else:
-                ws[f'A{row}'] = "No time tracking data available"
-                ws[f'A{row}'].font = Font(italic=True, color="666666")
+                rows.append([self._cell(ws, "No time tracking data available", font=self.NO_DATA_FONT)])
             
-            row += 2
+            rows.append([])
         
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 25
-        ws.column_dimensions['B'].width = 15
+        for sheet_row in rows:
+            ws.append(sheet_row)
     
     def add_data_table(
         self,
@@ -542,12 +524,12 @@ class ExcelBuilder:
         table_name: str = None
     ) -> int:
         """
-        Add a formatted data table to worksheet.
+        Append a formatted data table to a write-only worksheet.
         
         Args:
             ws: Target worksheet
             data: List of dictionaries with data
-            start_row: Starting row
+            start_row: Row the table starts on (the sheet's next row)
             columns: List of (header, data_key) tuples
             table_name: Optional table name for Excel table
             
@@ -558,21 +540,17 @@ class ExcelBuilder:
             return start_row
         
         # Write headers
-        for col, (header, _) in enumerate(columns, 1):
-            cell = ws.cell(row=start_row, column=col, value=header)
-            cell.font = self.HEADER_FONT
-            cell.fill = self.HEADER_FILL
-            cell.alignment = Alignment(horizontal='center')
+        ws.append(self._header_cells(ws, [header for header, _ in columns], alignment=self.CENTER_ALIGN))
         
         # Write data
         for row_idx, row_data in enumerate(data, start_row + 1):
-            for col, (_, key) in enumerate(columns, 1):
-                value = row_data.get(key, '')
-                cell = ws.cell(row=row_idx, column=col, value=value)
-                
-                # Alternate row colors
-                if row_idx % 2 == 0:
-                    cell.fill = self.ALT_ROW_FILL
+            values = [row_data.get(key, '') for _, key in columns]
+            
+            # Alternate row colors
+            if row_idx % 2 == 0:
+                values = [self._cell(ws, value, fill=self.ALT_ROW_FILL) for value in values]
+            
+            ws.append(values)
         
         end_row = start_row + len(data)
         end_col = len(columns)
@@ -589,7 +567,14 @@ class ExcelBuilder:
                 showColumnStripes=False
             )
             table.tableStyleInfo = style
-            ws.add_table(table)
+
+            # Write-only sheets can't read the headers back from the cells
+            table.tableColumns = [TableColumn(id=i, name=header) for i, (header, _) in enumerate(columns, 1)]
+
+            # openpyxl warns on every write-only add_table, even with the columns set above
+            with warnings.catch_warnings():
+                warnings.filterwarnings('ignore', message='In write-only mode you must add table columns manually')
+                ws.add_table(table)
         
         return end_row + 1
 
@@ -4,10 +4,17 @@ Common utility functions used across the application.
 """
 
 import re
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 from dateutil import parser as date_parser
-import pytz
+
+# Jira issue key (e.g. "PROJ-123"), compiled once for extract_issue_key
+_JIRA_KEY_RE = re.compile(r'([A-Z][A-Z0-9]+-\d+)')
+
+# Null-byte deletion table and truncation marker for sanitize_string
+_NULL_STRIP = str.maketrans('', '', '\x00')
+_ELLIPSIS = '...'
 
 
 def parse_jira_datetime(dt_string: Optional[str]) -> Optional[datetime]:
@@ -23,6 +30,12 @@ def parse_jira_datetime(dt_string: Optional[str]) -> Optional[datetime]:
     if not dt_string:
         return None
     
+    # Jira emits ISO 8601, which fromisoformat parses directly (Python 3.11+)
+    try:
+        return datetime.fromisoformat(dt_string)
+    except (ValueError, TypeError):
+        pass
+    
     try:
         return date_parser.parse(dt_string)
     except (ValueError, TypeError):
@@ -100,13 +113,17 @@ def calculate_business_days(start: datetime, end: datetime) -> int:
     if hasattr(end, 'date'):
         end = end.date()
     
-    business_days = 0
-    current = start
+    if end < start:
+        return 0
+    
+    # Every full week has 5 business days; count the leftover days individually
+    full_weeks, extra_days = divmod((end - start).days + 1, 7)
+    business_days = full_weeks * 5
     
-    while current <= end:
-        if current.weekday() < 5:  # Monday = 0, Friday = 4
+    start_weekday = start.weekday()
+    for offset in range(extra_days):
+        if (start_weekday + offset) % 7 < 5:  # Monday = 0, Friday = 4
             business_days += 1
-        current += timedelta(days=1)
     
     return business_days
 
@@ -124,11 +141,35 @@ def extract_issue_key(text: str) -> Optional[str]:
     if not text:
         return None
     
-    pattern = r'([A-Z][A-Z0-9]+-\d+)'
-    match = re.search(pattern, text)
+    match = _JIRA_KEY_RE.search(text)
     return match.group(1) if match else None
 
 
+def chunk_iter(iterable: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """
+    Lazily split an iterable into chunks of specified size.
+    
+    Args:
+        iterable: Items to chunk (consumed one chunk at a time)
+        chunk_size: Size of each chunk
+        
+    Yields:
+        Lists of up to chunk_size items
+    """
+    # Lists can be sliced directly
+    if isinstance(iterable, list):
+        for i in range(0, len(iterable), chunk_size):
+            yield iterable[i:i + chunk_size]
+        return
+    
+    it = iter(iterable)
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
 def chunk_list(lst: List[Any], chunk_size: int) -> List[List[Any]]:
     """
     Split a list into chunks of specified size.
@@ -140,7 +181,7 @@ def chunk_list(lst: List[Any], chunk_size: int) -> List[List[Any]]:
     Returns:
         List of chunks
     """
-    return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
+    return list(chunk_iter(lst, chunk_size))
 
 
 def safe_get(data: Dict, *keys, default=None) -> Any:
@@ -180,12 +221,13 @@ def sanitize_string(text: Optional[str], max_length: int = None) -> Optional[str
     if text is None:
         return None
     
-    # Remove null bytes
-    text = text.replace('\x00', '')
+    # Remove null bytes (rare, so check before translating)
+    if '\x00' in text:
+        text = text.translate(_NULL_STRIP)
     
     # Truncate if needed
     if max_length and len(text) > max_length:
-        text = text[:max_length - 3] + '...'
+        return text[:max_length - 3] + _ELLIPSIS
     
     return text
 
@@ -225,7 +267,7 @@ def get_date_range(days: int) -> tuple:
     Returns:
         Tuple of (start_date, end_date)
     """
-    end_date = datetime.now(pytz.UTC)
+    end_date = datetime.now(timezone.utc)
     start_date = end_date - timedelta(days=days)
     return start_date, end_date
 
@@ -3,29 +3,135 @@ Logging Configuration Module
 Provides consistent logging across the application.
 """
 
+import atexit
 import logging
 import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 from src.config_manager import ConfigManager
 
+# Third-party loggers held at WARNING unless logging.quiet_loggers overrides them
+_QUIET_LOGGERS = ('urllib3', 'requests', 'sqlalchemy.engine')
+
+# Background thread writing queued records to the console/file handlers
+_listener = None
+
+# Set to stop the periodic log file flush thread
+_flush_stop = None
+
+# Root logger's QueueHandler and the logging config it was built from
+_queue_handler = None
+_configured_key = None
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler writing through a 64 KB buffer.
+    
+    Records below WARNING are not flushed individually; the buffer is
+    flushed when full, on WARNING and above, and by flush() (called
+    periodically by setup_logging and on shutdown). The file size is
+    tracked in memory, so rollover checks need no seek/tell per record.
+    """
+    
+    BUFFER_SIZE = 64 * 1024
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Characters in the current file (the stock check also counts len(msg))
+        self._bytes_written = os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+        # Like the stock check, never rotate special files such as /dev/null
+        if os.path.exists(self.baseFilename) and not os.path.isfile(self.baseFilename):
+            self.maxBytes = 0
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.BUFFER_SIZE, encoding=self.encoding, errors=self.errors)
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        return self.maxBytes > 0 and self._bytes_written >= self.maxBytes
+    
+    def doRollover(self) -> None:
+        super().doRollover()
+        self._bytes_written = 0
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            if self.maxBytes > 0 and self._bytes_written + len(msg) >= self.maxBytes:
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(msg)
+            self._bytes_written += len(msg)
+            if record.levelno >= logging.WARNING:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+def _flush_periodically(handlers, interval: float, stop: threading.Event) -> None:
+    """Flush the given handlers every interval seconds until stop is set."""
+    while not stop.wait(interval):
+        for handler in handlers:
+            handler.flush()
+
+
+def _stop_listener() -> None:
+    """Drain the log queue and flush buffered records to the log file."""
+    _flush_stop.set()
+    _listener.stop()
+    for handler in _listener.handlers:
+        # The console handler flushes per record (and stdout may already be closed)
+        if isinstance(handler, MemoryHandler):
+            handler.flush()
+            handler.target.flush()
+
+
+def _close_listener_handlers() -> None:
+    """Close the stopped listener's handlers, releasing the log file."""
+    for handler in _listener.handlers:
+        handler.close()
+        if isinstance(handler, MemoryHandler) and handler.target is not None:
+            handler.target.close()
+
 
 def setup_logging() -> None:
     """
     Setup application-wide logging configuration.
-    Call this once at application startup.
+    Call this once at application startup; repeat calls with an unchanged
+    logging config are no-ops.
+    
+    Log calls only enqueue the record; a QueueListener thread does the
+    console and file I/O so callers never block on disk writes. File
+    records are buffered and written in batches of buffer_capacity, or
+    immediately once a record at flush_level or above arrives.
     """
+    global _listener, _queue_handler, _configured_key, _flush_stop
+    
     config = ConfigManager()
     log_config = config.get_logging_config()
     
+    # Already configured from the same settings (and still attached)
+    root_logger = logging.getLogger()
+    config_key = sorted(log_config.items())
+    if config_key == _configured_key and _queue_handler in root_logger.handlers:
+        return
+    
     # Get configuration values
     log_level = getattr(logging, log_config.get('level', 'INFO').upper())
     log_format = log_config.get('format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     log_file = log_config.get('file', './logs/jira_mcp.log')
-    max_bytes = log_config.get('max_bytes', 10485760)  # 10MB
-    backup_count = log_config.get('backup_count', 5)
+    max_bytes = log_config.get('max_bytes', 67108864)  # 64MB
+    backup_count = log_config.get('backup_count', 3)
+    buffer_capacity = log_config.get('buffer_capacity', 512)
+    flush_level = getattr(logging, log_config.get('flush_level', 'ERROR').upper())
+    flush_interval = log_config.get('flush_interval', 1.0)
     
     # Ensure log directory exists
     log_path = Path(log_file)
@@ -35,32 +141,66 @@ def setup_logging() -> None:
     formatter = logging.Formatter(log_format)
     
     # Setup root logger
-    root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
     
-    # Clear existing handlers
+    # Close and clear existing handlers (and stop a listener from a previous call)
+    for handler in root_logger.handlers:
+        handler.close()
     root_logger.handlers.clear()
+    if _listener is not None:
+        _stop_listener()
+        _close_listener_handlers()
+        atexit.unregister(_stop_listener)
     
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(log_level)
-    console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    # Console handler (logging.console: false skips it when stdout only duplicates the file)
+    handlers = []
+    if log_config.get('console', True):
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(log_level)
+        console_handler.setFormatter(formatter)
+        handlers.append(console_handler)
     
     # File handler with rotation
-    file_handler = RotatingFileHandler(
+    file_handler = BufferedRotatingFileHandler(
         log_file,
         maxBytes=max_bytes,
         backupCount=backup_count
     )
     file_handler.setLevel(log_level)
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
+    
+    # Buffer file records so writes and rotation checks happen once per batch
+    buffered_file_handler = MemoryHandler(
+        buffer_capacity,
+        flushLevel=flush_level,
+        target=file_handler,
+        flushOnClose=True
+    )
+    buffered_file_handler.setLevel(log_level)
+    handlers.append(buffered_file_handler)
+    
+    # Route records through a queue to the handlers above
+    log_queue = queue.Queue(-1)
+    _queue_handler = QueueHandler(log_queue)
+    root_logger.addHandler(_queue_handler)
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    
+    # Write buffered file records out periodically, and on shutdown
+    _flush_stop = threading.Event()
+    threading.Thread(
+        target=_flush_periodically,
+        args=((buffered_file_handler, file_handler), flush_interval, _flush_stop),
+        name='log-flush',
+        daemon=True
+    ).start()
+    atexit.register(_stop_listener)
     
     # Reduce noise from third-party libraries
-    logging.getLogger('urllib3').setLevel(logging.WARNING)
-    logging.getLogger('requests').setLevel(logging.WARNING)
-    logging.getLogger('sqlalchemy.engine').setLevel(logging.WARNING)
+    for name in log_config.get('quiet_loggers', _QUIET_LOGGERS):
+        logging.getLogger(name).setLevel(logging.WARNING)
+    
+    _configured_key = config_key
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -76,10 +216,42 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+# LoggerMixin loggers keyed by class, resolved once per class
+_LOGGER_CACHE = {}
+
+
 class LoggerMixin:
-    """Mixin class to add logging capability to any class."""
+    """
+    Mixin class to add logging capability to any class.
+    
+    The log_* helpers take %-style arguments (log_debug("took %d ms", ms))
+    rather than pre-formatted f-strings, so nothing is formatted when the
+    level is disabled.
+    """
     
     @property
     def logger(self) -> logging.Logger:
         """Get logger for this class."""
-        return logging.getLogger(self.__class__.__module__ + '.' + self.__class__.__name__)
+        cls = self.__class__
+        logger = _LOGGER_CACHE.get(cls)
+        if logger is None:
+            logger = _LOGGER_CACHE.setdefault(cls, logging.getLogger(cls.__module__ + '.' + cls.__name__))
+        return logger
+    
+    def log_debug(self, msg: str, *args) -> None:
+        """Log at DEBUG, formatting lazily only if DEBUG is enabled."""
+        logger = self.logger
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(msg, *args)
+    
+    def log_info(self, msg: str, *args) -> None:
+        """Log at INFO, formatting lazily only if INFO is enabled."""
+        logger = self.logger
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(msg, *args)
+    
+    def log_warning(self, msg: str, *args) -> None:
+        """Log at WARNING, formatting lazily only if WARNING is enabled."""
+        logger = self.logger
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(msg, *args)
@@ -1,6 +1,7 @@
-import unittest
-from datetime import datetime, timedelta
-import pytz
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
 from scripts.batch_extract_employees import (
     check_mit_compliance,
     check_updates_compliance,
@@ -10,91 +11,87 @@ from scripts.batch_extract_employees import (
     check_zero_tolerance
 )
 
-class TestComplianceLogic(unittest.TestCase):
-    def setUp(self):
-        self.now = datetime.now(pytz.UTC)
-        self.start_date = self.now - timedelta(days=28)
-        self.user_email = "test@example.com"
-        self.user_account_id = "12345"
-
-    def test_mit_compliance(self):
-        # Case 1: No MITs
-        self.assertEqual(check_mit_compliance([], self.start_date, self.now)[0], 'No')
-        
-        # Case 2: Open MIT
-        issues = [{
-            'fields': {
-                'labels': ['MIT'],
-                'priority': {'name': 'High'},
-                'status': {'name': 'In Progress'}
-            }
-        }]
-        self.assertEqual(check_mit_compliance(issues, self.start_date, self.now)[0], 'No')
-        
-        # Case 3: Closed MIT
-        issues[0]['fields']['status']['name'] = 'Done'
-        issues[0]['fields']['resolutiondate'] = self.now.strftime('%Y-%m-%dT%H:%M:%S.%f%z')
-        self.assertEqual(check_mit_compliance(issues, self.start_date, self.now)[0], 'Yes')
-
-    def test_updates_compliance(self):
-        # Case 1: No comments
-        self.assertEqual(check_updates_compliance([], self.user_email, self.start_date, self.now)[0], 'No')
-        
-        # Case 2: Wed and Fri comments
-        # Find next Wed and Fri from start_date
-        wed = self.start_date + timedelta(days=(2 - self.start_date.weekday() + 7) % 7)
-        fri = self.start_date + timedelta(days=(4 - self.start_date.weekday() + 7) % 7)
-        
-        issues = [{
-            'fields': {
-                'comment': {
-                    'comments': [
-                        {'author': {'emailAddress': self.user_email}, 'created': wed.strftime('%Y-%m-%dT%H:%M:%S.%f%z')},
-                        {'author': {'emailAddress': self.user_email}, 'created': fri.strftime('%Y-%m-%dT%H:%M:%S.%f%z')}
-                    ]
-                }
-            }
-        }]
-        self.assertEqual(check_updates_compliance(issues, self.user_email, self.start_date, self.now)[0], 'Yes')
-
-    def test_roles_compliance(self):
-        # Case 1: Self-assigned
-        issues = [{
-            'fields': {
-                'reporter': {'accountId': self.user_account_id},
-                'assignee': {'accountId': self.user_account_id}
-            }
-        }]
-        self.assertEqual(check_roles_compliance(issues, self.user_account_id)[0], 'No')
-        
-        # Case 2: Different user
-        issues[0]['fields']['reporter']['accountId'] = '67890'
-        self.assertEqual(check_roles_compliance(issues, self.user_account_id)[0], 'Yes')
-
-    def test_documentation_compliance(self):
-        # Case 1: Empty description
-        issues = [{'fields': {'description': ''}}]
-        self.assertEqual(check_documentation_compliance(issues)[0], 'No')
-        
-        # Case 2: Good description
-        issues = [{'fields': {'description': 'A reasonable description of the task.'}}]
-        self.assertEqual(check_documentation_compliance(issues)[0], 'Yes')
-
-    def test_status_hygiene(self):
-        # Case 1: Stale issue
-        stale_date = self.now - timedelta(days=10)
-        issues = [{
-            'fields': {
-                'updated': stale_date.strftime('%Y-%m-%dT%H:%M:%S.%f%z'),
-                'status': {'name': 'In Progress'}
-            }
-        }]
-        self.assertEqual(check_status_hygiene(issues)[0], 'No')
-        
-        # Case 2: Fresh issue
-        fresh_date = self.now - timedelta(days=2)
-        issues[0]['fields']['updated'] = fresh_date.strftime('%Y-%m-%dT%H:%M:%S.%f%z')
-        self.assertEqual(check_status_hygiene(issues)[0], 'Yes')
-
-if __name__ == '__main__':
-    unittest.main()
+USER_EMAIL = "test@example.com"
+USER_ACCOUNT_ID = "12345"
+JIRA_TIMESTAMP = '%Y-%m-%dT%H:%M:%S.%f%z'
+
+
+@pytest.fixture(scope="module")
+def now():
+    return datetime.now(timezone.utc)
+
+
+@pytest.fixture(scope="module")
+def start_date(now):
+    return now - timedelta(days=28)
+
+
+@pytest.mark.parametrize("status, expected", [
+    (None, 'No'),           # No MITs
+    ('In Progress', 'No'),  # Open MIT
+    ('Done', 'Yes'),        # Closed MIT
+])
+def test_mit_compliance(now, start_date, status, expected):
+    issues = []
+    if status:
+        fields = {'labels': ['MIT'], 'priority': {'name': 'High'}, 'status': {'name': status}}
+        if status == 'Done':
+            fields['resolutiondate'] = now.strftime(JIRA_TIMESTAMP)
+        issues.append({'fields': fields})
+
+    assert check_mit_compliance(issues, start_date, now)[0] == expected
+
+
+@pytest.mark.parametrize("weekdays, expected", [
+    ((), 'No'),      # No comments
+    ((2, 4), 'Yes'), # Wed and Fri comments
+])
+def test_updates_compliance(now, start_date, weekdays, expected):
+    # Next occurrence of each weekday from start_date
+    comments = [
+        {
+            'author': {'emailAddress': USER_EMAIL},
+            'created': (start_date + timedelta(days=(weekday - start_date.weekday() + 7) % 7)).strftime(JIRA_TIMESTAMP)
+        }
+        for weekday in weekdays
+    ]
+    issues = [{'fields': {'comment': {'comments': comments}}}] if comments else []
+
+    assert check_updates_compliance(issues, USER_EMAIL, start_date, now)[0] == expected
+
+
+@pytest.mark.parametrize("reporter_id, expected", [
+    (USER_ACCOUNT_ID, 'No'),  # Self-assigned
+    ('67890', 'Yes'),         # Different user
+])
+def test_roles_compliance(reporter_id, expected):
+    issues = [{
+        'fields': {
+            'reporter': {'accountId': reporter_id},
+            'assignee': {'accountId': USER_ACCOUNT_ID}
+        }
+    }]
+    assert check_roles_compliance(issues, USER_ACCOUNT_ID)[0] == expected
+
+
+@pytest.mark.parametrize("description, expected", [
+    ('', 'No'),                                       # Empty description
+    ('A reasonable description of the task.', 'Yes'), # Good description
+])
+def test_documentation_compliance(description, expected):
+    issues = [{'fields': {'description': description}}]
+    assert check_documentation_compliance(issues)[0] == expected
+
+
+@pytest.mark.parametrize("days_since_update, expected", [
+    (10, 'No'),  # Stale issue
+    (2, 'Yes'),  # Fresh issue
+])
+def test_status_hygiene(now, days_since_update, expected):
+    issues = [{
+        'fields': {
+            'updated': (now - timedelta(days=days_since_update)).strftime(JIRA_TIMESTAMP),
+            'status': {'name': 'In Progress'}
+        }
+    }]
+    assert check_status_hygiene(issues)[0] == expected
@@ -0,0 +1,86 @@
+"""
+Unit Tests for Audit Result Cache
+Tests hits, misses and invalidation of cached per-ticket results.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.reports import audit_cache
+from src.reports.audit_cache import AuditResultCache
+
+CONFIG = {'core_process_compliance': {'status_hygiene': {'enabled': True}}}
+RESULTS = {'status_hygiene': {'status': 'Pass', 'reason': 'All status transitions valid'}}
+
+
+def ticket(key, updated='2026-01-20T10:00:00.000+0000'):
+    return {'key': key, 'fields': {'updated': updated}}
+
+
+class TestAuditResultCache(unittest.TestCase):
+    """Test AuditResultCache get_many/put_many."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmp.name) / 'audit_cache.sqlite'
+        self.cache = AuditResultCache(self.db_path, CONFIG)
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp.cleanup()
+
+    def test_hit_after_put(self):
+        """Stored results are returned for an unchanged ticket."""
+        self.cache.put_many([ticket('TEST-1')], {'TEST-1': RESULTS})
+
+        self.assertEqual(self.cache.get_many([ticket('TEST-1')]), {'TEST-1': RESULTS})
+
+    def test_miss_for_unknown_ticket(self):
+        """Tickets never stored are not returned."""
+        self.cache.put_many([ticket('TEST-1')], {'TEST-1': RESULTS})
+
+        self.assertEqual(self.cache.get_many([ticket('TEST-2')]), {})
+
+    def test_updated_ticket_invalidates(self):
+        """A changed 'updated' timestamp is a miss."""
+        self.cache.put_many([ticket('TEST-1')], {'TEST-1': RESULTS})
+
+        hits = self.cache.get_many([ticket('TEST-1', updated='2026-01-21T10:00:00.000+0000')])
+        self.assertEqual(hits, {})
+
+    def test_config_change_invalidates(self):
+        """Entries written under different criteria configuration are misses."""
+        self.cache.put_many([ticket('TEST-1')], {'TEST-1': RESULTS})
+
+        other = AuditResultCache(self.db_path, {'core_process_compliance': {}})
+        try:
+            self.assertEqual(other.get_many([ticket('TEST-1')]), {})
+        finally:
+            other.close()
+
+    def test_check_code_change_invalidates(self):
+        """Entries written by different check code are misses."""
+        self.cache.put_many([ticket('TEST-1')], {'TEST-1': RESULTS})
+
+        with patch.object(audit_cache, '_CHECKS_SOURCE_HASH', 'changed'):
+            other = AuditResultCache(self.db_path, CONFIG)
+        try:
+            self.assertEqual(other.get_many([ticket('TEST-1')]), {})
+        finally:
+            other.close()
+
+    def test_persists_across_instances(self):
+        """Results survive reopening the database with the same configuration."""
+        self.cache.put_many([ticket('TEST-1')], {'TEST-1': RESULTS})
+
+        reopened = AuditResultCache(self.db_path, CONFIG)
+        try:
+            self.assertEqual(reopened.get_many([ticket('TEST-1')]), {'TEST-1': RESULTS})
+        finally:
+            reopened.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,7 +5,7 @@ Tests each compliance check with mock JIRA data.
 
 import unittest
 from datetime import datetime
-from unittest.mock import Mock
+from types import SimpleNamespace
 
 from src.compliance.checks import (
     StatusHygieneCheck,
@@ -17,13 +17,16 @@ from src.compliance.checks import (
     ZeroToleranceCheck
 )
 
+# Shared by every test case (never mutated)
+EMPLOYEE = SimpleNamespace(account_id='user123', display_name='Test User')
+
 
 class TestStatusHygieneCheck(unittest.TestCase):
     """Test status hygiene compliance check."""
     
     def setUp(self):
         self.check = StatusHygieneCheck()
-        self.employee = Mock(account_id='user123', display_name='Test User')
+        self.employee = EMPLOYEE
     
     def test_valid_transitions(self):
         """Test that valid transitions pass."""
@@ -87,7 +90,7 @@ class TestCancellationCheck(unittest.TestCase):
     
     def setUp(self):
         self.check = CancellationCheck()
-        self.employee = Mock(account_id='user123', display_name='Test User')
+        self.employee = EMPLOYEE
     
     def test_no_cancellations(self):
         """Test that no cancellations returns No (good)."""
@@ -179,7 +182,7 @@ class TestRoleOwnershipCheck(unittest.TestCase):
     
     def setUp(self):
         self.check = RoleOwnershipCheck()
-        self.employee = Mock(account_id='user123', display_name='Test User')
+        self.employee = EMPLOYEE
     
     def test_valid_roles(self):
         """Test valid reporter and assignee."""
@@ -239,7 +242,7 @@ class TestDocumentationCheck(unittest.TestCase):
     
     def setUp(self):
         self.check = DocumentationCheck()
-        self.employee = Mock(account_id='user123', display_name='Test User')
+        self.employee = EMPLOYEE
     
     def test_complete_documentation(self):
         """Test complete documentation passes."""
@@ -290,7 +293,7 @@ class TestLifecycleCheck(unittest.TestCase):
     
     def setUp(self):
         self.check = LifecycleCheck()
-        self.employee = Mock(account_id='user123', display_name='Test User')
+        self.employee = EMPLOYEE
     
     def test_proper_lifecycle(self):
         """Test proper lifecycle passes."""
@@ -0,0 +1,78 @@
+"""
+Unit Tests for Compliance Data Service Cache
+Tests the persisted LRU cache: round-trip, TTL expiry, eviction and malformed files.
+"""
+
+import json
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import Mock
+
+from src.reports.compliance_data_service import ComplianceDataService
+
+RECORDS = [{'employee_name': 'Test User', 'week_start_date': '2026-01-19', 'overall_compliance': 'Pass'}]
+
+
+class TestComplianceDataServiceCache(unittest.TestCase):
+    """Test ComplianceDataService cache persistence."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_path = Path(self.tmp.name) / 'compliance_cache.json'
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def service(self):
+        return ComplianceDataService(Mock(), cache_path=str(self.cache_path))
+
+    def test_round_trip(self):
+        """Stored entries are reloaded by a new service instance."""
+        self.service()._store_cache('team_None_week_0', RECORDS)
+
+        reloaded = self.service()
+        self.assertEqual(reloaded._cache['team_None_week_0'][0], RECORDS)
+
+    def test_expired_entries_not_loaded(self):
+        """Entries older than the TTL are dropped on load."""
+        self.cache_path.write_text(json.dumps({
+            'fresh': [RECORDS, time.time()],
+            'stale': [RECORDS, time.time() - 301]
+        }))
+
+        self.assertEqual(list(self.service()._cache), ['fresh'])
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted beyond 128 entries."""
+        service = self.service()
+        for i in range(128):
+            service._store_cache(f'key_{i}', RECORDS)
+        service._cache.move_to_end('key_0')  # key_0 used most recently
+        service._store_cache('key_128', RECORDS)
+
+        self.assertEqual(len(service._cache), 128)
+        self.assertNotIn('key_1', service._cache)
+        self.assertIn('key_0', service._cache)
+        self.assertIn('key_128', service._cache)
+
+    def test_malformed_file_ignored(self):
+        """Valid JSON of the wrong shape does not break initialization."""
+        for content in ('[]', '{"k": 5}', '{"k": [[], "x"]}', 'not json'):
+            with self.subTest(content=content):
+                self.cache_path.write_text(content)
+                self.assertEqual(len(self.service()._cache), 0)
+
+    def test_malformed_entries_skipped(self):
+        """Well-formed entries are kept when others in the file are malformed."""
+        self.cache_path.write_text(json.dumps({
+            'good': [RECORDS, time.time()],
+            'bad': [RECORDS, 'x']
+        }))
+
+        self.assertEqual(list(self.service()._cache), ['good'])
+
+
+if __name__ == '__main__':
+    unittest.main()